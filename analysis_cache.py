@@ -0,0 +1,85 @@
+"""Persistent store of frame analyses so restarts and replayed sessions skip the model.
+
+Entries are keyed by the analysis prompt plus the frame's exact byte digest, and hold
+the model's raw reply; callers re-parse it with the same decoder a fresh reply goes
+through. Perceptual (dHash) matching is deliberately left to the in-memory
+FrameAnalysisCache in front of it: a coarse hash cannot tell HP bars or menu text
+apart, and a wrong match here would be replayed for the whole TTL.
+"""
+
+import hashlib
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+
+def cache_key(prompt: str, frame_digest: int) -> str:
+    """Key for one (prompt, frame) pair; a prompt change invalidates every entry."""
+    digest = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16)
+    digest.update(frame_digest.to_bytes(8, "little"))
+    return digest.hexdigest()
+
+
+class AnalysisStore:
+    """SQLite table of analysis replies with a TTL; expired rows are pruned on open."""
+
+    def __init__(self, path: str, ttl: float = 86400 * 30) -> None:
+        self._path = path
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._disabled = not path
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if self._conn is None and not self._disabled:
+            try:
+                Path(self._path).parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(self._path, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS analyses ("
+                    "key TEXT PRIMARY KEY, reply TEXT NOT NULL, ts REAL NOT NULL)"
+                )
+                if self._ttl > 0:
+                    conn.execute("DELETE FROM analyses WHERE ts < ?", (time.time() - self._ttl,))
+                conn.commit()
+                self._conn = conn
+            except Exception as exc:  # pragma: no cover - unwritable cache dir
+                print(f"Analysis cache disabled: {exc}", file=sys.stderr)
+                self._disabled = True
+        return self._conn
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute("SELECT reply FROM analyses WHERE key = ?", (key,)).fetchone()
+            except sqlite3.Error:
+                return None
+        return row[0] if row else None
+
+    def set(self, key: str, reply: str) -> None:
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO analyses (key, reply, ts) VALUES (?, ?, ?)",
+                    (key, reply, time.time()),
+                )
+                conn.commit()
+            except sqlite3.Error:
+                pass
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,34 @@
+"""Typed msgspec view of the frame-analysis fields the capture loop reads.
+
+The model's reply itself stays a plain dict: payloads, summaries and the frame log
+carry it as parsed, so every key the model sent, null or not, and whatever its type,
+passes through untouched. `analysis_view` converts that dict into the small
+`AnalysisFrame` below, which declares only the scene and character names the loop
+inspects; msgspec skips every other key while converting. Those fields are typed
+`Any` because the model is not perfectly consistent, and a reply whose `characters`
+block is not a list of objects gets an empty view instead of being rejected.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import msgspec
+
+
+class Character(msgspec.Struct, gc=False):
+    name: Any = None
+
+
+class AnalysisFrame(msgspec.Struct, gc=False):
+    scene: Any = None
+    characters: Optional[List[Optional[Character]]] = None
+
+
+_EMPTY_VIEW = AnalysisFrame()
+
+
+def analysis_view(data: Dict[str, Any]) -> AnalysisFrame:
+    """Return the typed view of a parsed analysis dict; empty when its shape is off."""
+    try:
+        return msgspec.convert(data, AnalysisFrame)
+    except msgspec.ValidationError:
+        return _EMPTY_VIEW
@@ -1,48 +1,64 @@
 #!/usr/bin/env python3
-"""Simple Flask app for PokéAPI chat functionality."""
+"""Simple Quart app for PokéAPI chat functionality."""
 
 import os
-import json
 from datetime import datetime
-from flask import Flask, request, jsonify
+from quart import Quart, Response, request
 from dotenv import load_dotenv
-from retroarch_capture import build_chat_agent, process_chat_message
+from pokeapi_tool import start_warmup
+from retroarch_capture import OrjsonProvider, build_chat_agent, json_response, process_chat_message_async
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
 
 # Load environment variables
 load_dotenv()
 
-app = Flask(__name__)
+
+app = Quart(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+
+# Static body for load-balancer polling; never worth re-serialising
+_HEALTH_BODY = b'{"service":"pokemon-chat","status":"healthy"}'
 
 # Create chat agent
 model = os.getenv("MODEL", "gpt-4o")
 chat_agent = build_chat_agent(model)
 
+@app.before_serving
+async def warm_pokeapi_cache():
+    """Prefetch Kanto profiles in the background once this worker starts serving."""
+    start_warmup()
+
 @app.route("/api/chat", methods=["POST"])
-def chat_endpoint():
+async def chat_endpoint():
     """Handle chat messages and return PokéAPI responses."""
     try:
-        data = request.get_json()
+        data = await request.get_json()
         if not data:
-            return jsonify({"error": "No JSON data provided"}), 400
+            return json_response({"error": "No JSON data provided"}, 400)
             
         message = data.get("message", "")
         if not message:
-            return jsonify({"error": "No message provided"}), 400
+            return json_response({"error": "No message provided"}, 400)
         
         # Process the message
-        response = process_chat_message(chat_agent, message)
+        response = await process_chat_message_async(chat_agent, message)
         
-        return jsonify({
+        return json_response({
             "response": response,
             "timestamp": datetime.now().isoformat()
         })
     except Exception as e:
-        return jsonify({"error": f"Chat error: {str(e)}"}), 500
+        return json_response({"error": f"Chat error: {str(e)}"}, 500)
 
 @app.route("/health", methods=["GET"])
-def health_check():
+async def health_check():
     """Health check endpoint."""
-    return jsonify({"status": "healthy", "service": "pokemon-chat"})
+    return Response(_HEALTH_BODY, mimetype="application/json")
 
 if __name__ == "__main__":
     port = int(os.getenv("CHAT_PORT", "5052"))
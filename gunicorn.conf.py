@@ -0,0 +1,15 @@
+"""Gunicorn settings for the chat service: `gunicorn -c gunicorn.conf.py chat_app:app`.
+
+chat_app is an ASGI (Quart) app, so each worker runs uvicorn's event loop (uvloop when
+installed) and serves many in-flight agent calls concurrently.
+"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('CHAT_PORT', '5052')}"
+workers = int(os.getenv("CHAT_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+worker_class = "uvicorn.workers.UvicornWorker"
+keepalive = 5
+# No preload_app: pokeapi_tool's HTTP pools, executors and warm-up thread are not
+# fork-safe, so each worker imports the app itself after the fork.
@@ -0,0 +1,245 @@
+"""In-process macOS screen capture backed by ScreenCaptureKit.
+
+The `screencapture` CLI forks a process, rebuilds a capture session and round-trips an
+image through disk for every frame. `SCKCapturer` keeps one SCStream open for the life
+of the capture loop instead: ScreenCaptureKit delivers BGRA frames at the configured
+interval and only the newest one is held, so a frame costs nothing until it is used.
+
+Requires macOS 12.3+, pyobjc (`pyobjc-framework-ScreenCaptureKit`, which pulls in the
+CoreMedia and Quartz bindings) and Pillow. When any of them is missing
+`SCK_AVAILABLE` is False and callers fall back to the `screencapture` CLI.
+`quartz_window_bounds` and `quartz_list_windows` only need the Quartz bindings.
+"""
+
+import threading
+from typing import Any, Callable, Optional
+
+try:
+    import Quartz
+except ImportError:  # pragma: no cover - non-macOS or pyobjc not installed
+    Quartz = None
+
+try:
+    import objc
+    import CoreMedia
+    import ScreenCaptureKit
+    from Foundation import NSObject
+    from PIL import Image
+except ImportError:  # pragma: no cover - non-macOS or pyobjc/Pillow not installed
+    SCK_AVAILABLE = False
+else:
+    SCK_AVAILABLE = Quartz is not None
+
+QUARTZ_AVAILABLE = Quartz is not None
+
+_CALLBACK_TIMEOUT_SECONDS = 5.0
+
+
+if SCK_AVAILABLE:
+
+    class _FrameSink(NSObject, protocols=[objc.protocolNamed("SCStreamOutput")]):
+        """SCStreamOutput delegate that hands each screen sample to its capturer."""
+
+        def initWithCapturer_(self, capturer):
+            self = objc.super(_FrameSink, self).init()
+            if self is None:
+                return None
+            self.capturer = capturer
+            return self
+
+        def stream_didOutputSampleBuffer_ofType_(self, stream, sample_buffer, output_type):
+            if output_type != ScreenCaptureKit.SCStreamOutputTypeScreen:
+                return
+            # Idle/blank samples carry no image buffer; keep the previous frame.
+            pixel_buffer = CoreMedia.CMSampleBufferGetImageBuffer(sample_buffer)
+            if pixel_buffer is not None:
+                self.capturer._store(pixel_buffer)
+
+
+def quartz_window_bounds(app_name: str) -> tuple[int, int, int, int] | None:
+    """
+    Return (x, y, width, height) of app_name's frontmost on-screen window.
+    Reads the WindowServer list in-process, so no osascript subprocess is spawned.
+    """
+    if Quartz is None:
+        return None
+    windows = Quartz.CGWindowListCopyWindowInfo(
+        Quartz.kCGWindowListOptionOnScreenOnly | Quartz.kCGWindowListExcludeDesktopElements,
+        Quartz.kCGNullWindowID,
+    )
+    # The list is ordered front to back; layer 0 skips menu bar items and overlays.
+    for info in windows or []:
+        if info.get(Quartz.kCGWindowOwnerName) != app_name or info.get(Quartz.kCGWindowLayer, 0) != 0:
+            continue
+        rect = info.get(Quartz.kCGWindowBounds) or {}
+        width = int(rect.get("Width", 0))
+        height = int(rect.get("Height", 0))
+        if width > 0 and height > 0:
+            return int(rect.get("X", 0)), int(rect.get("Y", 0)), width, height
+    return None
+
+
+def quartz_list_windows() -> list[tuple[str, str]]:
+    """
+    Return (owner_name, window_title) for every normal on-screen window, front to back.
+    Titles are only visible with the screen recording permission; without it they are "".
+    """
+    if Quartz is None:
+        return []
+    windows = Quartz.CGWindowListCopyWindowInfo(
+        Quartz.kCGWindowListOptionOnScreenOnly | Quartz.kCGWindowListExcludeDesktopElements,
+        Quartz.kCGNullWindowID,
+    )
+    return [
+        (str(info.get(Quartz.kCGWindowOwnerName) or ""), str(info.get(Quartz.kCGWindowName) or ""))
+        for info in windows or []
+        if info.get(Quartz.kCGWindowLayer, 0) == 0
+    ]
+
+
+def _wait_for(start: Callable[[Callable[..., None]], None], what: str) -> tuple:
+    """Run an async ScreenCaptureKit call and block until its completion handler fires."""
+
+    done = threading.Event()
+    result: list[Any] = []
+
+    def handler(*args: Any) -> None:
+        result.extend(args)
+        done.set()
+
+    start(handler)
+    if not done.wait(_CALLBACK_TIMEOUT_SECONDS):
+        raise RuntimeError(f"Timed out waiting for {what}")
+    return tuple(result)
+
+
+def _content_filter(content: Any, app_name: str) -> tuple[Any, int, int]:
+    """Filter on app_name's front on-screen window, or the main display if it has none."""
+
+    for window in content.windows():
+        app = window.owningApplication()
+        if app is None or app.applicationName() != app_name or not window.isOnScreen():
+            continue
+        frame = window.frame()
+        content_filter = ScreenCaptureKit.SCContentFilter.alloc().initWithDesktopIndependentWindow_(window)
+        scale = content_filter.pointPixelScale() if hasattr(content_filter, "pointPixelScale") else 1.0
+        return content_filter, int(frame.size.width * scale), int(frame.size.height * scale)
+
+    display = content.displays()[0]
+    content_filter = ScreenCaptureKit.SCContentFilter.alloc().initWithDisplay_excludingWindows_(display, [])
+    return content_filter, int(display.width()), int(display.height())
+
+
+def _to_image(pixel_buffer: Any) -> "Image.Image":
+    """Copy a BGRA CVPixelBuffer into an RGB Pillow image."""
+
+    Quartz.CVPixelBufferLockBaseAddress(pixel_buffer, Quartz.kCVPixelBufferLock_ReadOnly)
+    try:
+        width = Quartz.CVPixelBufferGetWidth(pixel_buffer)
+        height = Quartz.CVPixelBufferGetHeight(pixel_buffer)
+        stride = Quartz.CVPixelBufferGetBytesPerRow(pixel_buffer)
+        raw = Quartz.CVPixelBufferGetBaseAddress(pixel_buffer).as_buffer(stride * height)
+        # BGRX -> RGB makes Pillow unpack (and so copy) while the buffer is locked.
+        return Image.frombuffer("RGB", (width, height), raw, "raw", "BGRX", stride, 1)
+    finally:
+        Quartz.CVPixelBufferUnlockBaseAddress(pixel_buffer, Quartz.kCVPixelBufferLock_ReadOnly)
+
+
+class SCKCapturer:
+    """A long-lived ScreenCaptureKit stream that keeps only the latest frame."""
+
+    def __init__(self, app_name: str, interval: float, max_edge: int = 0) -> None:
+        self.app_name = app_name
+        self.interval = max(float(interval), 0.0)
+        self.max_edge = max(int(max_edge), 0)
+        self.width = 0
+        self.height = 0
+        self._lock = threading.Lock()
+        self._pixel_buffer: Any = None
+        self._stream: Any = None
+        self._sink: Any = None
+
+    def start(self) -> None:
+        """Open the stream; raises RuntimeError if ScreenCaptureKit refuses."""
+
+        if not SCK_AVAILABLE:
+            raise RuntimeError("ScreenCaptureKit bindings are not installed")
+
+        content, error = _wait_for(
+            lambda handler: ScreenCaptureKit.SCShareableContent.getShareableContentExcludingDesktopWindows_onScreenWindowsOnly_completionHandler_(
+                True, True, handler
+            ),
+            "shareable content",
+        )
+        if content is None:
+            raise RuntimeError(f"Shareable content unavailable (screen recording permission?): {error}")
+
+        content_filter, width, height = _content_filter(content, self.app_name)
+        # Let the GPU downscale: SCK renders straight into a buffer of the configured
+        # size, so oversized frames never reach the CPU or the JPEG encoder.
+        longest = max(width, height)
+        if self.max_edge and longest > self.max_edge:
+            width = max(1, round(width * self.max_edge / longest))
+            height = max(1, round(height * self.max_edge / longest))
+        self.width, self.height = width, height
+
+        config = ScreenCaptureKit.SCStreamConfiguration.alloc().init()
+        config.setWidth_(self.width)
+        config.setHeight_(self.height)
+        config.setMinimumFrameInterval_(CoreMedia.CMTimeMakeWithSeconds(self.interval, 600))
+        config.setPixelFormat_(Quartz.kCVPixelFormatType_32BGRA)
+        config.setShowsCursor_(False)
+        config.setQueueDepth_(3)
+
+        stream = ScreenCaptureKit.SCStream.alloc().initWithFilter_configuration_delegate_(content_filter, config, None)
+        sink = _FrameSink.alloc().initWithCapturer_(self)
+        ok, error = stream.addStreamOutput_type_sampleHandlerQueue_error_(
+            sink, ScreenCaptureKit.SCStreamOutputTypeScreen, None, None
+        )
+        if not ok:
+            raise RuntimeError(f"Could not attach stream output: {error}")
+
+        (error,) = _wait_for(stream.startCaptureWithCompletionHandler_, "stream start")
+        if error is not None:
+            raise RuntimeError(f"Could not start capture stream: {error}")
+
+        self._stream = stream
+        self._sink = sink
+
+    def stop(self) -> None:
+        stream, self._stream = self._stream, None
+        if stream is not None:
+            try:
+                _wait_for(stream.stopCaptureWithCompletionHandler_, "stream stop")
+            except Exception:  # pragma: no cover - best effort on shutdown
+                pass
+        with self._lock:
+            self._pixel_buffer = None
+        self._sink = None
+
+    def _store(self, pixel_buffer: Any) -> None:
+        with self._lock:
+            self._pixel_buffer = pixel_buffer
+
+    def latest_frame(self) -> Optional["Image.Image"]:
+        """Return the most recent frame as an RGB image, or None before the first one."""
+
+        with self._lock:
+            pixel_buffer = self._pixel_buffer
+        if pixel_buffer is None:
+            return None
+        return _to_image(pixel_buffer)
+
+
+def start_capturer(app_name: str, interval: float, max_edge: int = 0) -> Optional[SCKCapturer]:
+    """Start an SCKCapturer, or return None when ScreenCaptureKit can't be used."""
+
+    if not SCK_AVAILABLE:
+        return None
+    capturer = SCKCapturer(app_name, interval, max_edge)
+    try:
+        capturer.start()
+    except Exception as exc:
+        print(f"ScreenCaptureKit unavailable, falling back to screencapture: {exc}")
+        return None
+    return capturer
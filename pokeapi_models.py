@@ -0,0 +1,127 @@
+"""Typed msgspec views of the PokéAPI responses the tools read.
+
+Only the fields the extractors use are declared; msgspec skips everything else while
+decoding, so the ~900-entry move lists and sprite blocks never become Python objects
+beyond what is kept. Optional sub-objects are nullable so a missing or null block
+falls back to "unknown" instead of failing extraction.
+
+The schemas hold only scalars and nested structs, so they can never form reference
+cycles; `gc=False` keeps the thousands of decoded entries out of the cyclic GC.
+"""
+
+from typing import List
+
+import msgspec
+
+
+class Named(msgspec.Struct, gc=False):
+    """A PokéAPI NamedAPIResource (the `url` half is never used)."""
+
+    name: str = "unknown"
+
+
+UNKNOWN = Named()
+
+
+class TypeSlot(msgspec.Struct, gc=False):
+    type: Named | None = None
+
+
+class AbilitySlot(msgspec.Struct, gc=False):
+    ability: Named | None = None
+
+
+class MoveSlot(msgspec.Struct, gc=False):
+    move: Named | None = None
+
+
+class StatEntry(msgspec.Struct, gc=False):
+    base_stat: int | None = None
+    stat: Named | None = None
+
+
+class EffectEntry(msgspec.Struct, gc=False):
+    effect: str = "No description available"
+    short_effect: str = "No short description available"
+    language: Named | None = None
+
+
+class FlavorTextEntry(msgspec.Struct, gc=False):
+    text: str = "No short description available"
+    language: Named | None = None
+
+
+NO_EFFECT = EffectEntry()
+NO_FLAVOR_TEXT = FlavorTextEntry()
+
+
+class DamageRelations(msgspec.Struct, gc=False):
+    double_damage_to: List[Named] = []
+    half_damage_to: List[Named] = []
+    no_damage_to: List[Named] = []
+    double_damage_from: List[Named] = []
+    half_damage_from: List[Named] = []
+    no_damage_from: List[Named] = []
+
+
+class PokemonResp(msgspec.Struct, gc=False):
+    id: int | None = None
+    name: str | None = None
+    types: List[TypeSlot] = []
+    abilities: List[AbilitySlot] = []
+    stats: List[StatEntry] = []
+    moves: List[MoveSlot] = []
+    height: int | None = None
+    weight: int | None = None
+
+
+class SpeciesResp(msgspec.Struct, gc=False):
+    id: int | None = None
+    name: str | None = None
+    gender_rate: int | None = None
+
+
+class AbilityResp(msgspec.Struct, gc=False):
+    id: int | None = None
+    name: str | None = None
+    effect_entries: List[EffectEntry] = []
+    is_main_series: bool = False
+    generation: Named | None = None
+
+
+class MoveResp(msgspec.Struct, gc=False):
+    id: int | None = None
+    name: str | None = None
+    effect_entries: List[EffectEntry] = []
+    type: Named | None = None
+    power: int | None = None
+    accuracy: int | None = None
+    pp: int | None = None
+    priority: int | None = None
+    damage_class: Named | None = None
+    generation: Named | None = None
+
+
+class TypeResp(msgspec.Struct, gc=False):
+    id: int | None = None
+    name: str | None = None
+    generation: Named | None = None
+    damage_relations: DamageRelations = msgspec.field(default_factory=DamageRelations)
+
+
+class ItemResp(msgspec.Struct, gc=False):
+    id: int | None = None
+    name: str | None = None
+    effect_entries: List[EffectEntry] = []
+    flavor_text_entries: List[FlavorTextEntry] = []
+    cost: int | None = None
+    category: Named | None = None
+    generation: Named | None = None
+
+
+class LocationResp(msgspec.Struct, gc=False):
+    id: int | None = None
+    name: str | None = None
+    region: Named | None = None
+    areas: List[Named] = []
+    generation: Named | None = None
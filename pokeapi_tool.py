@@ -1,44 +1,282 @@
+import atexit
+import contextlib
 import json
+import logging
 import os
-from typing import Any, Dict, List, Tuple
-
-import requests
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import msgspec
+import urllib3
 from agents import function_tool
+from dotenv import load_dotenv
+
+import pokeapi_models as models
+from type_chart import TYPE_CHART, TYPE_NAMES_BY_ID
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - HTTP/2 transport is opt-in
+    httpx = None
+
+__all__ = [
+    "fetch_pokemon_profile",
+    "fetch_pokemon_gender",
+    "fetch_pokemon_abilities",
+    "fetch_pokemon_moves",
+    "fetch_pokemon_types",
+    "fetch_pokemon_items",
+    "fetch_pokemon_locations",
+    "pull_latest_pokemon_calls",
+    "record_pokemon_calls",
+    "start_warmup",
+]
+
+# The knobs below are read once at import; importers (chat_app, the capture CLI)
+# load .env later, so read it here or settings made there would be ignored.
+load_dotenv()
 
 _POKEAPI_BASE = os.getenv("POKEAPI_BASE_URL", "https://pokeapi.co/api/v2")
-_pokemon_cache: Dict[str, Dict[str, Any]] = {}
-_type_weakness_cache: Dict[str, List[str]] = {}
-_gender_cache: Dict[str, Dict[str, Any]] = {}
-_ability_cache: Dict[str, Dict[str, Any]] = {}
-_move_cache: Dict[str, Dict[str, Any]] = {}
-_type_cache: Dict[str, Dict[str, Any]] = {}
-_item_cache: Dict[str, Dict[str, Any]] = {}
-_location_cache: Dict[str, Dict[str, Any]] = {}
-_latest_pokemon_calls: List[Dict[str, Any]] = []
-
-
-def _get_json(url: str) -> Tuple[Dict[str, Any] | None, str | None]:
+_CACHE_PATH = os.getenv("POKEAPI_CACHE_PATH", str(Path(__file__).resolve().parent / ".cache" / "pokeapi.sqlite3"))
+# PokéAPI resources are effectively immutable; 0 stores disk entries without an expiry.
+_CACHE_TTL_SECONDS = float(os.getenv("POKEAPI_CACHE_TTL", str(86400 * 30)))
+_DEBUG = os.getenv("POKEAPI_TOOL_DEBUG") == "1"
+
+_logger = logging.getLogger("pokeapi_tool")
+if _DEBUG and not _logger.handlers:
+    # Keep the old stdout trace format when debugging is switched on.
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(logging.Formatter("[POKEAPI_TOOL] %(message)s"))
+    _logger.addHandler(_handler)
+    _logger.setLevel(logging.DEBUG)
+# Bounded so an undrained log cannot grow without limit; oldest calls drop first.
+_latest_pokemon_calls: deque = deque(maxlen=1024)
+# Set by record_pokemon_calls(); calls made under it go to that run's list instead.
+_run_calls: ContextVar[Optional[List[Dict[str, Any]]]] = ContextVar("pokeapi_run_calls", default=None)
+
+
+class _LRUCache(OrderedDict):
+    """Dict cache that evicts the least recently used entry once maxsize is exceeded.
+
+    Reads must go through `get` to refresh recency. Tools run on worker threads, so
+    a concurrent eviction between steps is tolerated instead of locked against.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        try:
+            value = super().__getitem__(key)
+            self.move_to_end(key)
+        except KeyError:
+            return default
+        return value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        try:
+            self.move_to_end(key)
+            while len(self) > self.maxsize:
+                self.popitem(last=False)
+        except KeyError:
+            pass
+
+
+# Concurrency: tools, the warm-up and prefetch pools all touch these caches from worker
+# threads without a lock. That relies on every write being a single `cache[key] = value`
+# (atomic under the GIL; _LRUCache tolerates racing evictions) and on values being
+# immutable once stored. Do not add read-modify-write updates or setdefault here.
+_pokemon_cache: _LRUCache = _LRUCache(1024)
+_type_weakness_cache: _LRUCache = _LRUCache(64)
+_gender_cache: _LRUCache = _LRUCache(1024)
+_ability_cache: _LRUCache = _LRUCache(512)
+_move_cache: _LRUCache = _LRUCache(1024)
+_type_cache: _LRUCache = _LRUCache(64)
+_item_cache: _LRUCache = _LRUCache(1024)
+_location_cache: _LRUCache = _LRUCache(512)
+# (kind, key) -> (monotonic expiry, (payload, json)) for failed lookups. A 404 is a
+# typo or hallucinated name and stays an error; anything else may be transient.
+_negative_cache: _LRUCache = _LRUCache(512)
+_NEGATIVE_TTL_SECONDS = {"http_404": 60.0}
+_NEGATIVE_TTL_DEFAULT = 5.0
+
+# One keep-alive pool shared by every fetcher so repeat calls reuse the TLS connection.
+# urllib3 directly: the fetchers only issue plain GETs, so requests' layers buy nothing.
+_HTTP = urllib3.PoolManager(
+    num_pools=4,
+    maxsize=64,
+    # Advertise every codec urllib3 can decode here (gzip/deflate, plus br/zstd when
+    # brotli or zstandard is installed); body bytes go straight to the msgspec decoder.
+    headers=urllib3.util.make_headers(accept_encoding=True, user_agent="gamedev-pokeapi-tool/1.0"),
+    retries=urllib3.Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    ),
+    timeout=urllib3.Timeout(connect=3, read=10),
+)
+atexit.register(_HTTP.clear)
+
+# Opt-in HTTP/2: multiplexes concurrent misses (batch fetch, warm-up) over one socket.
+_H2_CLIENT = None
+if os.getenv("POKEAPI_HTTP2") == "1":
+    if httpx is None:
+        print("POKEAPI_HTTP2=1 ignored: httpx is not installed", file=sys.stderr)
+    else:
+        try:
+            _H2_CLIENT = httpx.Client(
+                headers={"User-Agent": "gamedev-pokeapi-tool/1.0"},
+                timeout=httpx.Timeout(10.0, connect=3.0),
+                transport=httpx.HTTPTransport(
+                    http2=True,
+                    retries=2,
+                    limits=httpx.Limits(max_keepalive_connections=4, max_connections=10),
+                ),
+            )
+            atexit.register(_H2_CLIENT.close)
+        except ImportError:  # pragma: no cover - httpx without the h2 extra
+            print("POKEAPI_HTTP2=1 ignored: install httpx[http2]", file=sys.stderr)
+_TYPE_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="pokeapi-type")
+# Off by default: each new profile would fan out up to 40 extra move requests.
+_PREFETCH_MOVES = os.getenv("POKEAPI_PREFETCH_MOVES") == "1"
+_PREFETCH_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="pokeapi-prefetch")
+
+if orjson is not None:
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    _loads = orjson.loads
+else:  # pragma: no cover - stdlib fallback
+    def _dumps(obj: Any) -> str:
+        # Match orjson's compact, unescaped UTF-8 output
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+    _loads = json.loads
+
+
+class _DiskCache:
+    """SQLite-backed second tier for extracted payloads so restarts start warm."""
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._disabled = not path
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if self._conn is None and not self._disabled:
+            try:
+                Path(self._path).parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(self._path, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS entries ("
+                    "kind TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, expires REAL NOT NULL, "
+                    "PRIMARY KEY (kind, key))"
+                )
+                conn.commit()
+                self._conn = conn
+            except Exception as exc:  # pragma: no cover - unwritable cache dir
+                print(f"PokéAPI disk cache disabled: {exc}", file=sys.stderr)
+                self._disabled = True
+        return self._conn
+
+    def get(self, kind: str, key: str) -> str | None:
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT value FROM entries WHERE kind = ? AND key = ? AND expires > ?",
+                    (kind, key, time.time()),
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+        return row[0] if row else None
+
+    def set(self, kind: str, key: str, value: str) -> None:
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (kind, key, value, expires) VALUES (?, ?, ?, ?)",
+                    (kind, key, value, time.time() + _CACHE_TTL_SECONDS if _CACHE_TTL_SECONDS > 0 else float("inf")),
+                )
+                conn.commit()
+            except sqlite3.Error:
+                pass
+
+    def _after_fork(self) -> None:
+        # SQLite handles must not cross fork(), and the lock may have been held mid-query.
+        self._lock = threading.Lock()
+        self._conn = None
+
+
+_DISK = _DiskCache(_CACHE_PATH)
+os.register_at_fork(after_in_child=_DISK._after_fork)
+_TYPE_DECODER = msgspec.json.Decoder(models.TypeResp)
+
+
+def _get_json(url: str, decoder: msgspec.json.Decoder) -> Tuple[Any | None, str | None]:
+    """GET url and decode the body straight into the decoder's msgspec Struct."""
     try:
-        resp = requests.get(url, timeout=10)
+        if _H2_CLIENT is not None:
+            resp = _H2_CLIENT.get(url)
+            status, body = resp.status_code, resp.content
+        else:
+            resp = _HTTP.request("GET", url)
+            status, body = resp.status, resp.data
     except Exception as exc:
         return None, f"request_error: {exc}"
-    if resp.status_code != 200:
-        return None, f"http_{resp.status_code}"
+    if status != 200:
+        return None, f"http_{status}"
     try:
-        return resp.json(), None
+        return decoder.decode(body), None
     except Exception as exc:
         return None, f"parse_error: {exc}"
 
 
 def _normalise_name(name: str | None) -> str:
-    return (name or "").strip().lower()
+    # Interned keys let cache probes short-circuit on identity; clean input skips the copies.
+    if not name:
+        return ""
+    if name.islower() and not (name[0].isspace() or name[-1].isspace()):
+        return sys.intern(name)
+    return sys.intern(name.strip().lower())
 
 
 def _record_call(names: List[str], payload: Dict[str, Any]) -> None:
-    _latest_pokemon_calls.append({
+    entry = {
         "names": names,
         "data": payload,
-    })
+    }
+    run_calls = _run_calls.get()
+    if run_calls is not None:
+        run_calls.append(entry)
+    else:
+        _latest_pokemon_calls.append(entry)
+
+
+def _chart_entry(key: str) -> Dict[str, Any] | None:
+    return TYPE_CHART.get(key) or TYPE_CHART.get(TYPE_NAMES_BY_ID.get(key, ""))
 
 
 def _fetch_type_weaknesses(type_name: str) -> List[str]:
@@ -46,21 +284,20 @@ def _fetch_type_weaknesses(type_name: str) -> List[str]:
     if not key:
         return []
 
-    if key in _type_weakness_cache:
-        return _type_weakness_cache[key]
+    entry = _chart_entry(key)
+    if entry is not None:
+        return entry["double_damage_from"]
+
+    # Types missing from the static chart (future generations) still go over HTTP.
+    cached = _type_weakness_cache.get(key)
+    if cached is not None:
+        return cached
 
-    url = f"{_POKEAPI_BASE}/type/{key}/"
-    data, err = _get_json(url)
-    if err or not data:
+    data, err = _get_json(_POKEAPI_BASE + "/type/" + key + "/", _TYPE_DECODER)
+    if err or data is None:
         weaknesses: List[str] = []
     else:
-        relations = data.get("damage_relations") or {}
-        double_from = relations.get("double_damage_from") or []
-        weaknesses = [
-            _normalise_name((entry or {}).get("name"))
-            for entry in double_from
-            if isinstance((entry or {}).get("name"), str)
-        ]
+        weaknesses = [_normalise_name(entry.name) for entry in data.damage_relations.double_damage_from]
         weaknesses = [name for name in dict.fromkeys(weaknesses) if name]
 
     _type_weakness_cache[key] = weaknesses
@@ -68,144 +305,318 @@ def _fetch_type_weaknesses(type_name: str) -> List[str]:
 
 
 def _collect_weaknesses(type_names: List[str]) -> List[str]:
+    # Dual-type misses overlap their round-trips; chart and cache hits never leave this thread.
+    keys = [_normalise_name(t) for t in type_names]
+    misses = [key for key in keys if _chart_entry(key) is None and key not in _type_weakness_cache]
+    futures = {key: _TYPE_POOL.submit(_fetch_type_weaknesses, key) for key in misses} if len(misses) > 1 else {}
+
     weaknesses: List[str] = []
-    for type_name in type_names:
-        weaknesses.extend(_fetch_type_weaknesses(type_name))
+    for key in keys:
+        future = futures.get(key)
+        weaknesses.extend(future.result() if future else _fetch_type_weaknesses(key))
 
     ordered_unique = [name for name in dict.fromkeys(weaknesses) if name]
     return ordered_unique
 
 
+@contextlib.contextmanager
+def record_pokemon_calls() -> Iterator[List[Dict[str, Any]]]:
+    """Collect the Pokémon endpoint calls made inside the block into the yielded list.
+
+    Scoped with a context variable, which tasks and the SDK's tool threads inherit, so
+    concurrent agent runs each see only their own calls. Those calls skip the shared
+    log that pull_latest_pokemon_calls drains.
+    """
+    calls: List[Dict[str, Any]] = []
+    token = _run_calls.set(calls)
+    try:
+        yield calls
+    finally:
+        _run_calls.reset(token)
+
+
 def pull_latest_pokemon_calls() -> List[Dict[str, Any]]:
     """Return and clear the log of recent Pokémon endpoint calls."""
-    global _latest_pokemon_calls
-    calls = _latest_pokemon_calls
-    _latest_pokemon_calls = []
-    return calls
+    # popleft is atomic, so a call recorded mid-drain is kept for the next pull, not lost.
+    calls = []
+    while True:
+        try:
+            calls.append(_latest_pokemon_calls.popleft())
+        except IndexError:
+            return calls
+
+
+def _pick_en(entries: List[Any]) -> Any | None:
+    """Return the first English entry of a localised list, or None if there is none."""
+    # Plain loop rather than next(genexpr): no generator frame, one attribute read per row.
+    for entry in entries:
+        lang = entry.language
+        if lang is not None and lang.name == "en":
+            return entry
+    return None
+
+
+def _extract_pokemon(data: models.PokemonResp) -> Dict[str, Any]:
+    types = [t.type.name for t in data.types if t.type]
+    abilities = [a.ability.name for a in data.abilities if a.ability]
+    stats = {s.stat.name: s.base_stat for s in data.stats if s.base_stat is not None and s.stat}
+    weaknesses = _collect_weaknesses(types)
+    move_names = (m.move.name for m in data.moves if m.move)
+    # Stop at the first 40 unique moves; the rest is only scanned for one more new name.
+    seen = set()
+    limited_moves = []
+    for nm in move_names:
+        if nm not in seen:
+            seen.add(nm)
+            limited_moves.append(nm)
+            if len(limited_moves) == 40:
+                break
+    moves_truncated = any(nm not in seen for nm in move_names)
+
+    return {
+        "id": data.id,
+        "name": data.name,
+        "types": types,
+        "abilities": abilities,
+        "base_stats": stats,
+        "moves": limited_moves,
+        "moves_truncated": moves_truncated,
+        "height": data.height,
+        "weight": data.weight,
+        "weaknesses": weaknesses,
+    }
+
+
+def _extract_gender(data: models.SpeciesResp) -> Dict[str, Any]:
+    gender_rate = data.gender_rate
+    if gender_rate == -1:
+        gender_info = "genderless"
+    else:
+        # Gender rate is 0-8, where 0 = 100% male, 8 = 100% female
+        female_percentage = (gender_rate / 8) * 100
+        male_percentage = 100 - female_percentage
+        gender_info = f"{male_percentage:.1f}% male, {female_percentage:.1f}% female"
+
+    return {
+        "id": data.id,
+        "name": data.name,
+        "gender_rate": gender_rate,
+        "gender_info": gender_info,
+        "is_genderless": gender_rate == -1,
+    }
+
+
+def _extract_ability(data: models.AbilityResp) -> Dict[str, Any]:
+    # English description and short description come from the same entry
+    en = _pick_en(data.effect_entries) or models.NO_EFFECT
+
+    return {
+        "id": data.id,
+        "name": data.name,
+        "description": en.effect,
+        "short_effect": en.short_effect,
+        "is_main_series": data.is_main_series,
+        "generation": (data.generation or models.UNKNOWN).name,
+    }
+
+
+def _extract_move(data: models.MoveResp) -> Dict[str, Any]:
+    # Get English description
+    description = (_pick_en(data.effect_entries) or models.NO_EFFECT).effect
+
+    return {
+        "id": data.id,
+        "name": data.name,
+        "description": description,
+        "type": (data.type or models.UNKNOWN).name,
+        "power": data.power,
+        "accuracy": data.accuracy,
+        "pp": data.pp,
+        "priority": data.priority,
+        "damage_class": (data.damage_class or models.UNKNOWN).name,
+        "generation": (data.generation or models.UNKNOWN).name,
+    }
+
+
+_RELATION_KEYS = (
+    "double_damage_to",
+    "half_damage_to",
+    "no_damage_to",
+    "double_damage_from",
+    "half_damage_from",
+    "no_damage_from",
+)
+
+
+def _extract_type(data: models.TypeResp) -> Dict[str, Any]:
+    relations = data.damage_relations
+
+    return {
+        "id": data.id,
+        "name": data.name,
+        "generation": (data.generation or models.UNKNOWN).name,
+        "effectiveness": {
+            rel: [entry.name for entry in getattr(relations, rel)] for rel in _RELATION_KEYS
+        },
+    }
+
+
+def _chart_type_payload(name: str) -> Dict[str, Any]:
+    entry = TYPE_CHART[name]
+    return {
+        "id": entry["id"],
+        "name": name,
+        "generation": entry["generation"],
+        "effectiveness": {rel: entry[rel] for rel in _RELATION_KEYS},
+    }
+
+
+# Chart-backed type payloads, serialised once and reachable by name or numeric id.
+_TYPE_PAYLOADS: Dict[str, Tuple[Dict[str, Any], str]] = {}
+for _name in TYPE_CHART:
+    _payload = _chart_type_payload(_name)
+    _TYPE_PAYLOADS[_name] = _TYPE_PAYLOADS[str(_payload["id"])] = (_payload, _dumps(_payload))
+
+
+def _extract_item(data: models.ItemResp) -> Dict[str, Any]:
+    return {
+        "id": data.id,
+        "name": data.name,
+        "description": (_pick_en(data.effect_entries) or models.NO_EFFECT).effect,
+        "short_description": (_pick_en(data.flavor_text_entries) or models.NO_FLAVOR_TEXT).text,
+        "cost": data.cost,
+        "category": (data.category or models.UNKNOWN).name,
+        "generation": (data.generation or models.UNKNOWN).name,
+    }
+
+
+def _extract_location(data: models.LocationResp) -> Dict[str, Any]:
+    return {
+        "id": data.id,
+        "name": data.name,
+        "region": (data.region or models.UNKNOWN).name,
+        "areas": [area.name for area in data.areas],
+        "generation": (data.generation or models.UNKNOWN).name,
+    }
+
+
+# kind -> (endpoint URL prefix, response decoder, extractor, memory cache, static lookup tried
+# before any cache). The kind doubles as the disk-cache namespace.
+_ENDPOINTS: Dict[str, Tuple[str, msgspec.json.Decoder, Callable, _LRUCache, Callable | None]] = {
+    "pokemon": (_POKEAPI_BASE + "/pokemon/", msgspec.json.Decoder(models.PokemonResp), _extract_pokemon, _pokemon_cache, None),
+    "gender": (_POKEAPI_BASE + "/pokemon-species/", msgspec.json.Decoder(models.SpeciesResp), _extract_gender, _gender_cache, None),
+    "ability": (_POKEAPI_BASE + "/ability/", msgspec.json.Decoder(models.AbilityResp), _extract_ability, _ability_cache, None),
+    "move": (_POKEAPI_BASE + "/move/", msgspec.json.Decoder(models.MoveResp), _extract_move, _move_cache, None),
+    "type": (_POKEAPI_BASE + "/type/", _TYPE_DECODER, _extract_type, _type_cache, _TYPE_PAYLOADS.get),
+    "item": (_POKEAPI_BASE + "/item/", msgspec.json.Decoder(models.ItemResp), _extract_item, _item_cache, None),
+    "location": (_POKEAPI_BASE + "/location/", msgspec.json.Decoder(models.LocationResp), _extract_location, _location_cache, None),
+}
+
+
+def _load(kind: str, key: str) -> Dict[str, Any]:
+    base, decoder, extract, _, _ = _ENDPOINTS[kind]
+    data, err = _get_json(base + key + "/", decoder)
+    if err or data is None:
+        return {"error": err or "unknown_error"}
 
+    try:
+        return extract(data)
+    except Exception as exc:
+        return {"error": f"extract_error: {exc}"}
 
-@function_tool
-def fetch_pokemon_profile(pokemon_name: str) -> str:
-    """Fetch Pokémon data (stats, types, abilities, moves) from the PokéAPI Pokémon endpoint.
 
-    Args:
-        pokemon_name: Pokémon identifier (name or id).
+def _cached(kind: str, key: str) -> Tuple[Dict[str, Any], str]:
+    """Resolve key through the static table, the in-memory LRU, the disk cache, then HTTP.
 
-    Returns:
-        JSON string containing the core Pokémon payload with lightweight trimming.
+    Returns the payload together with its JSON text; memory entries hold both so a
+    hit never re-serialises. Error payloads never reach the memory or disk tiers; they
+    are remembered only briefly so repeated bad names do not re-hit the network.
     """
-    if os.getenv("POKEAPI_TOOL_DEBUG") == "1":
-        print(f"[POKEAPI_TOOL] fetch_pokemon_profile({pokemon_name!r})", flush=True)
+    _, _, _, cache, static = _ENDPOINTS[kind]
+    if static is not None:
+        hit = static(key)
+        if hit is not None:
+            return hit
+
+    hit = cache.get(key)
+    if hit is not None:
+        return hit
+
+    failed = _negative_cache.get((kind, key))
+    if failed is not None and failed[0] > time.monotonic():
+        return failed[1]
+
+    stored = _DISK.get(kind, key)
+    if stored is not None:
+        entry = (_loads(stored), stored)
+        cache[key] = entry
+        return entry
+
+    result = _load(kind, key)
+    serialized = _dumps(result)
+    if "error" not in result:
+        entry = (result, serialized)
+        # Store under both the id and the canonical name, so "6" then "charizard" is one fetch.
+        for alias in {key, str(result.get("id") or ""), result.get("name") or ""}:
+            if alias:
+                alias = sys.intern(alias)
+                cache[alias] = entry
+                _DISK.set(kind, alias, serialized)
+    else:
+        ttl = _NEGATIVE_TTL_SECONDS.get(result["error"], _NEGATIVE_TTL_DEFAULT)
+        _negative_cache[(kind, key)] = (time.monotonic() + ttl, (result, serialized))
+    return result, serialized
 
-    key = _normalise_name(pokemon_name)
-    if not key:
-        return json.dumps({"error": "empty name"})
 
-    if key in _pokemon_cache:
-        cached = _pokemon_cache[key]
-        _record_call([key], cached)
-        return json.dumps(cached)
+_EMPTY_ERR = _dumps({"error": "empty name"})
 
-    url = f"{_POKEAPI_BASE}/pokemon/{key}/"
-    data, err = _get_json(url)
-    if err or not data:
-        payload = {"error": err or "unknown_error"}
-        _record_call([key], payload)
-        return json.dumps(payload)
 
-    try:
-        types = [t["type"]["name"] for t in data.get("types", []) if t.get("type")]
-        abilities = [a["ability"]["name"] for a in data.get("abilities", []) if a.get("ability")]
-        stats = {
-            (s.get("stat") or {}).get("name", "unknown"): s.get("base_stat")
-            for s in data.get("stats", []) or []
-            if isinstance(s.get("base_stat"), int)
-        }
-        height = data.get("height")
-        weight = data.get("weight")
-        weaknesses = _collect_weaknesses(types)
-        moves = []
-        for m in data.get("moves", []) or []:
-            mv = m.get("move") or {}
-            name = mv.get("name")
-            if isinstance(name, str):
-                moves.append(name)
-        dedup_moves = list(dict.fromkeys(moves))
-        limited_moves = dedup_moves[:40]
-
-        result = {
-            "id": data.get("id"),
-            "name": data.get("name"),
-            "types": types,
-            "abilities": abilities,
-            "base_stats": stats,
-            "moves": limited_moves,
-            "moves_truncated": len(dedup_moves) > len(limited_moves),
-            "height": height,
-            "weight": weight,
-            "weaknesses": weaknesses,
-        }
-    except Exception as exc:
-        result = {"error": f"extract_error: {exc}"}
+def _fetch(kind: str, name: str) -> str:
+    if _DEBUG:
+        _logger.debug("fetch %s(%r)", kind, name)
+
+    key = _normalise_name(name)
+    if not key:
+        return _EMPTY_ERR
 
-    _pokemon_cache[key] = result
+    result, serialized = _cached(kind, key)
     _record_call([key], result)
-    return json.dumps(result)
+    if _PREFETCH_MOVES and kind == "pokemon":
+        _prefetch_moves(result.get("moves") or ())
+    return serialized
+
+
+def _prefetch_moves(moves: Iterable[str]) -> None:
+    """Queue background loads for moves not yet cached, so follow-up move lookups hit memory."""
+    for name in moves:
+        if _move_cache.get(name) is None:
+            _PREFETCH_POOL.submit(_cached, "move", name)
 
 
 @function_tool
-def fetch_pokemon_gender(pokemon_name: str) -> str:
-    """Fetch Pokémon gender ratio data from the PokéAPI species endpoint.
+def fetch_pokemon_profile(pokemon_name: str) -> str:
+    """Fetch Pokémon data (stats, types, abilities, moves) from the PokéAPI Pokémon endpoint.
 
     Args:
         pokemon_name: Pokémon identifier (name or id).
 
     Returns:
-        JSON string containing gender ratio information.
+        JSON string containing the core Pokémon payload with lightweight trimming.
     """
-    if os.getenv("POKEAPI_TOOL_DEBUG") == "1":
-        print(f"[POKEAPI_TOOL] fetch_pokemon_gender({pokemon_name!r})", flush=True)
-
-    key = _normalise_name(pokemon_name)
-    if not key:
-        return json.dumps({"error": "empty name"})
+    return _fetch("pokemon", pokemon_name)
 
-    if key in _gender_cache:
-        cached = _gender_cache[key]
-        _record_call([key], cached)
-        return json.dumps(cached)
 
-    # First get the species data
-    url = f"{_POKEAPI_BASE}/pokemon-species/{key}/"
-    data, err = _get_json(url)
-    if err or not data:
-        payload = {"error": err or "unknown_error"}
-        _record_call([key], payload)
-        return json.dumps(payload)
+@function_tool
+def fetch_pokemon_gender(pokemon_name: str) -> str:
+    """Fetch Pokémon gender ratio data from the PokéAPI species endpoint.
 
-    try:
-        gender_rate = data.get("gender_rate")
-        if gender_rate == -1:
-            gender_info = "genderless"
-        else:
-            # Gender rate is 0-8, where 0 = 100% male, 8 = 100% female
-            female_percentage = (gender_rate / 8) * 100
-            male_percentage = 100 - female_percentage
-            gender_info = f"{male_percentage:.1f}% male, {female_percentage:.1f}% female"
-
-        result = {
-            "id": data.get("id"),
-            "name": data.get("name"),
-            "gender_rate": gender_rate,
-            "gender_info": gender_info,
-            "is_genderless": gender_rate == -1,
-        }
-    except Exception as exc:
-        result = {"error": f"extract_error: {exc}"}
+    Args:
+        pokemon_name: Pokémon identifier (name or id).
 
-    _gender_cache[key] = result
-    _record_call([key], result)
-    return json.dumps(result)
+    Returns:
+        JSON string containing gender ratio information.
+    """
+    return _fetch("gender", pokemon_name)
 
 
 @function_tool
@@ -218,55 +629,7 @@ def fetch_pokemon_abilities(ability_name: str) -> str:
     Returns:
         JSON string containing detailed ability information.
     """
-    if os.getenv("POKEAPI_TOOL_DEBUG") == "1":
-        print(f"[POKEAPI_TOOL] fetch_pokemon_abilities({ability_name!r})", flush=True)
-
-    key = _normalise_name(ability_name)
-    if not key:
-        return json.dumps({"error": "empty name"})
-
-    if key in _ability_cache:
-        cached = _ability_cache[key]
-        _record_call([key], cached)
-        return json.dumps(cached)
-
-    url = f"{_POKEAPI_BASE}/ability/{key}/"
-    data, err = _get_json(url)
-    if err or not data:
-        payload = {"error": err or "unknown_error"}
-        _record_call([key], payload)
-        return json.dumps(payload)
-
-    try:
-        # Get English description
-        effect_entries = data.get("effect_entries", [])
-        description = "No description available"
-        for entry in effect_entries:
-            if entry.get("language", {}).get("name") == "en":
-                description = entry.get("effect", "No description available")
-                break
-
-        # Get short description
-        short_effect = "No short description available"
-        for entry in effect_entries:
-            if entry.get("language", {}).get("name") == "en":
-                short_effect = entry.get("short_effect", "No short description available")
-                break
-
-        result = {
-            "id": data.get("id"),
-            "name": data.get("name"),
-            "description": description,
-            "short_effect": short_effect,
-            "is_main_series": data.get("is_main_series", False),
-            "generation": data.get("generation", {}).get("name", "unknown"),
-        }
-    except Exception as exc:
-        result = {"error": f"extract_error: {exc}"}
-
-    _ability_cache[key] = result
-    _record_call([key], result)
-    return json.dumps(result)
+    return _fetch("ability", ability_name)
 
 
 @function_tool
@@ -279,52 +642,7 @@ def fetch_pokemon_moves(move_name: str) -> str:
     Returns:
         JSON string containing detailed move information.
     """
-    if os.getenv("POKEAPI_TOOL_DEBUG") == "1":
-        print(f"[POKEAPI_TOOL] fetch_pokemon_moves({move_name!r})", flush=True)
-
-    key = _normalise_name(move_name)
-    if not key:
-        return json.dumps({"error": "empty name"})
-
-    if key in _move_cache:
-        cached = _move_cache[key]
-        _record_call([key], cached)
-        return json.dumps(cached)
-
-    url = f"{_POKEAPI_BASE}/move/{key}/"
-    data, err = _get_json(url)
-    if err or not data:
-        payload = {"error": err or "unknown_error"}
-        _record_call([key], payload)
-        return json.dumps(payload)
-
-    try:
-        # Get English description
-        effect_entries = data.get("effect_entries", [])
-        description = "No description available"
-        for entry in effect_entries:
-            if entry.get("language", {}).get("name") == "en":
-                description = entry.get("effect", "No description available")
-                break
-
-        result = {
-            "id": data.get("id"),
-            "name": data.get("name"),
-            "description": description,
-            "type": data.get("type", {}).get("name", "unknown"),
-            "power": data.get("power"),
-            "accuracy": data.get("accuracy"),
-            "pp": data.get("pp"),
-            "priority": data.get("priority"),
-            "damage_class": data.get("damage_class", {}).get("name", "unknown"),
-            "generation": data.get("generation", {}).get("name", "unknown"),
-        }
-    except Exception as exc:
-        result = {"error": f"extract_error: {exc}"}
-
-    _move_cache[key] = result
-    _record_call([key], result)
-    return json.dumps(result)
+    return _fetch("move", move_name)
 
 
 @function_tool
@@ -337,56 +655,7 @@ def fetch_pokemon_types(type_name: str) -> str:
     Returns:
         JSON string containing type effectiveness and weaknesses.
     """
-    if os.getenv("POKEAPI_TOOL_DEBUG") == "1":
-        print(f"[POKEAPI_TOOL] fetch_pokemon_types({type_name!r})", flush=True)
-
-    key = _normalise_name(type_name)
-    if not key:
-        return json.dumps({"error": "empty name"})
-
-    if key in _type_cache:
-        cached = _type_cache[key]
-        _record_call([key], cached)
-        return json.dumps(cached)
-
-    url = f"{_POKEAPI_BASE}/type/{key}/"
-    data, err = _get_json(url)
-    if err or not data:
-        payload = {"error": err or "unknown_error"}
-        _record_call([key], payload)
-        return json.dumps(payload)
-
-    try:
-        damage_relations = data.get("damage_relations", {})
-        
-        # Extract effectiveness data
-        double_damage_to = [entry["name"] for entry in damage_relations.get("double_damage_to", [])]
-        half_damage_to = [entry["name"] for entry in damage_relations.get("half_damage_to", [])]
-        no_damage_to = [entry["name"] for entry in damage_relations.get("no_damage_to", [])]
-        
-        double_damage_from = [entry["name"] for entry in damage_relations.get("double_damage_from", [])]
-        half_damage_from = [entry["name"] for entry in damage_relations.get("half_damage_from", [])]
-        no_damage_from = [entry["name"] for entry in damage_relations.get("no_damage_from", [])]
-
-        result = {
-            "id": data.get("id"),
-            "name": data.get("name"),
-            "generation": data.get("generation", {}).get("name", "unknown"),
-            "effectiveness": {
-                "double_damage_to": double_damage_to,
-                "half_damage_to": half_damage_to,
-                "no_damage_to": no_damage_to,
-                "double_damage_from": double_damage_from,
-                "half_damage_from": half_damage_from,
-                "no_damage_from": no_damage_from,
-            }
-        }
-    except Exception as exc:
-        result = {"error": f"extract_error: {exc}"}
-
-    _type_cache[key] = result
-    _record_call([key], result)
-    return json.dumps(result)
+    return _fetch("type", type_name)
 
 
 @function_tool
@@ -399,57 +668,7 @@ def fetch_pokemon_items(item_name: str) -> str:
     Returns:
         JSON string containing item information.
     """
-    if os.getenv("POKEAPI_TOOL_DEBUG") == "1":
-        print(f"[POKEAPI_TOOL] fetch_pokemon_items({item_name!r})", flush=True)
-
-    key = _normalise_name(item_name)
-    if not key:
-        return json.dumps({"error": "empty name"})
-
-    if key in _item_cache:
-        cached = _item_cache[key]
-        _record_call([key], cached)
-        return json.dumps(cached)
-
-    url = f"{_POKEAPI_BASE}/item/{key}/"
-    data, err = _get_json(url)
-    if err or not data:
-        payload = {"error": err or "unknown_error"}
-        _record_call([key], payload)
-        return json.dumps(payload)
-
-    try:
-        # Get English description
-        effect_entries = data.get("effect_entries", [])
-        description = "No description available"
-        for entry in effect_entries:
-            if entry.get("language", {}).get("name") == "en":
-                description = entry.get("effect", "No description available")
-                break
-
-        # Get short description
-        flavor_text_entries = data.get("flavor_text_entries", [])
-        short_description = "No short description available"
-        for entry in flavor_text_entries:
-            if entry.get("language", {}).get("name") == "en":
-                short_description = entry.get("text", "No short description available")
-                break
-
-        result = {
-            "id": data.get("id"),
-            "name": data.get("name"),
-            "description": description,
-            "short_description": short_description,
-            "cost": data.get("cost"),
-            "category": data.get("category", {}).get("name", "unknown"),
-            "generation": data.get("generation", {}).get("name", "unknown"),
-        }
-    except Exception as exc:
-        result = {"error": f"extract_error: {exc}"}
-
-    _item_cache[key] = result
-    _record_call([key], result)
-    return json.dumps(result)
+    return _fetch("item", item_name)
 
 
 @function_tool
@@ -462,45 +681,83 @@ def fetch_pokemon_locations(location_name: str) -> str:
     Returns:
         JSON string containing location information.
     """
-    if os.getenv("POKEAPI_TOOL_DEBUG") == "1":
-        print(f"[POKEAPI_TOOL] fetch_pokemon_locations({location_name!r})", flush=True)
-
-    key = _normalise_name(location_name)
-    if not key:
-        return json.dumps({"error": "empty name"})
-
-    if key in _location_cache:
-        cached = _location_cache[key]
-        _record_call([key], cached)
-        return json.dumps(cached)
-
-    url = f"{_POKEAPI_BASE}/location/{key}/"
-    data, err = _get_json(url)
-    if err or not data:
-        payload = {"error": err or "unknown_error"}
-        _record_call([key], payload)
-        return json.dumps(payload)
-
-    try:
-        # Get region information
-        region = data.get("region", {})
-        region_name = region.get("name", "unknown") if region else "unknown"
-
-        # Get area names
-        areas = []
-        for area in data.get("areas", []):
-            areas.append(area.get("name", "unknown"))
-
-        result = {
-            "id": data.get("id"),
-            "name": data.get("name"),
-            "region": region_name,
-            "areas": areas,
-            "generation": data.get("generation", {}).get("name", "unknown"),
-        }
-    except Exception as exc:
-        result = {"error": f"extract_error: {exc}"}
+    return _fetch("location", location_name)
+
+
+# Generation I national dex, prefetched by start_warmup().
+_KANTO_NAMES = [
+    "bulbasaur", "ivysaur", "venusaur", "charmander", "charmeleon", "charizard", "squirtle",
+    "wartortle", "blastoise", "caterpie", "metapod", "butterfree", "weedle", "kakuna", "beedrill",
+    "pidgey", "pidgeotto", "pidgeot", "rattata", "raticate", "spearow", "fearow", "ekans", "arbok",
+    "pikachu", "raichu", "sandshrew", "sandslash", "nidoran-f", "nidorina", "nidoqueen",
+    "nidoran-m", "nidorino", "nidoking", "clefairy", "clefable", "vulpix", "ninetales",
+    "jigglypuff", "wigglytuff", "zubat", "golbat", "oddish", "gloom", "vileplume", "paras",
+    "parasect", "venonat", "venomoth", "diglett", "dugtrio", "meowth", "persian", "psyduck",
+    "golduck", "mankey", "primeape", "growlithe", "arcanine", "poliwag", "poliwhirl", "poliwrath",
+    "abra", "kadabra", "alakazam", "machop", "machoke", "machamp", "bellsprout", "weepinbell",
+    "victreebel", "tentacool", "tentacruel", "geodude", "graveler", "golem", "ponyta", "rapidash",
+    "slowpoke", "slowbro", "magnemite", "magneton", "farfetchd", "doduo", "dodrio", "seel",
+    "dewgong", "grimer", "muk", "shellder", "cloyster", "gastly", "haunter", "gengar", "onix",
+    "drowzee", "hypno", "krabby", "kingler", "voltorb", "electrode", "exeggcute", "exeggutor",
+    "cubone", "marowak", "hitmonlee", "hitmonchan", "lickitung", "koffing", "weezing", "rhyhorn",
+    "rhydon", "chansey", "tangela", "kangaskhan", "horsea", "seadra", "goldeen", "seaking",
+    "staryu", "starmie", "mr-mime", "scyther", "jynx", "electabuzz", "magmar", "pinsir", "tauros",
+    "magikarp", "gyarados", "lapras", "ditto", "eevee", "vaporeon", "jolteon", "flareon",
+    "porygon", "omanyte", "omastar", "kabuto", "kabutops", "aerodactyl", "snorlax", "articuno",
+    "zapdos", "moltres", "dratini", "dragonair", "dragonite", "mewtwo", "mew",
+]
+
+
+class _SharedIterator:
+    """Thread-safe iterator over a list."""
+
+    def __init__(self, items: List[str]) -> None:
+        self._it = iter(items)
+        self._lock = threading.Lock()
+
+    def __iter__(self) -> "_SharedIterator":
+        return self
+
+    def __next__(self) -> str:
+        with self._lock:
+            return next(self._it)
+
+
+_WARMUP_THREADS = 8
+_warmup_lock = threading.Lock()
+_warmup_started = False
+# Set at exit so warm-up threads stop taking names; daemon threads never delay shutdown.
+_warmup_stop = threading.Event()
+atexit.register(_warmup_stop.set)
+
+
+def _warmup_worker(names: Iterable[str]) -> None:
+    # Bypasses _record_call so warm-up traffic never shows up in the call log.
+    # Types need no warm-up: they are served from the static chart.
+    for name in names:
+        if _warmup_stop.is_set():
+            return
+        _cached("pokemon", name)
+
+
+def start_warmup() -> None:
+    """Prefetch the Kanto Pokémon in the background so the first chat turns are cache hits.
+
+    Called by the server entry points rather than on import, so scripts and worker
+    processes that merely import the tools skip the 151 requests. No-op when
+    POKEAPI_WARMUP=0 or once started.
+    """
+    global _warmup_started
+    if os.getenv("POKEAPI_WARMUP", "1") != "1":
+        return
+    with _warmup_lock:
+        if _warmup_started:
+            return
+        _warmup_started = True
+    # A shared iterator hands each name to exactly one thread; plain daemon threads
+    # (not an executor, whose workers are joined at exit) let shutdown abandon
+    # requests still waiting on a slow PokéAPI.
+    names = _SharedIterator(_KANTO_NAMES)
+    for i in range(_WARMUP_THREADS):
+        threading.Thread(target=_warmup_worker, args=(names,), name=f"pokeapi-warmup-{i}", daemon=True).start()
 
-    _location_cache[key] = result
-    _record_call([key], result)
-    return json.dumps(result)
@@ -1,22 +1,38 @@
 import argparse
 import asyncio
+import atexit
 import base64
+import functools
+import hashlib
+import io
 import json
+import multiprocessing
 import os
-import queue
+import re
 import shutil
-import subprocess
 import sys
 import threading
 import time
 import uuid
+import weakref
+from collections import OrderedDict, deque
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, Optional
 
+import msgspec
 from dotenv import load_dotenv
-from flask import Flask, Response, render_template, stream_with_context, request, jsonify
-from openai import OpenAI
+from quart import Quart, Response, render_template, request
+from quart.json.provider import DefaultJSONProvider
+from hypercorn.asyncio import serve as hypercorn_serve
+from hypercorn.config import Config as HypercornConfig
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+from openai.types.responses import ResponseTextDeltaEvent
+from analysis_cache import AnalysisStore, cache_key
+from analysis_models import AnalysisFrame, analysis_view
+from macos_capture import SCKCapturer, start_capturer
+from window_detection import get_bounds_cached
 from pokeapi_tool import (
     fetch_pokemon_profile, 
     fetch_pokemon_gender,
@@ -25,24 +41,102 @@ from pokeapi_tool import (
     fetch_pokemon_types,
     fetch_pokemon_items,
     fetch_pokemon_locations,
-    pull_latest_pokemon_calls
+    record_pokemon_calls,
+    start_warmup,
 )
 
 try:
-    from agents import Agent, ModelSettings, Runner
+    from agents import Agent, ModelSettings, MultiProvider, RunConfig, Runner
 except Exception as exc:  # pragma: no cover
     print("openai-agents is required. pip install openai-agents", file=sys.stderr)
     raise
 
-# Ensure environment variables from .env are available whenever this module is imported.
-load_dotenv()
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - Pillow is optional without ScreenCaptureKit
+    Image = None
+
+try:
+    import pybase64
+except ImportError:  # pragma: no cover - pybase64 is an optional speedup
+    pybase64 = None
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - xxhash is an optional speedup
+    xxhash = None
+
+if orjson is not None:
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    def _dumps_indented_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _dumps_indented(obj: Any) -> str:
+        return _dumps_indented_bytes(obj).decode("utf-8")
+
+    _dumps_bytes = orjson.dumps
+    _loads = orjson.loads
+else:  # pragma: no cover - stdlib fallback
+    def _dumps(obj: Any) -> str:
+        # Match orjson's compact, unescaped UTF-8 output (as pokeapi_tool does)
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+    def _dumps_bytes(obj: Any) -> bytes:
+        return _dumps(obj).encode("utf-8")
+
+    def _dumps_indented(obj: Any) -> str:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
+    def _dumps_indented_bytes(obj: Any) -> bytes:
+        return _dumps_indented(obj).encode("utf-8")
+
+    _loads = json.loads
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that parses request bodies (and any `jsonify` payloads) with orjson."""
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_SORT_KEYS if self.sort_keys else 0
+        return orjson.dumps(obj, default=self.default, option=option).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+if pybase64 is not None:
+    # SIMD (AVX2/NEON) encoder that returns str directly, skipping the bytes round-trip.
+    _b64encode_str = pybase64.b64encode_as_string
+else:  # pragma: no cover - stdlib fallback
+    def _b64encode_str(data: bytes | memoryview) -> str:
+        return base64.b64encode(data).decode("ascii")
+
+def json_response(obj: Any, status: int = 200) -> Response:
+    """Return obj as an application/json response, serialised straight to bytes."""
+    return Response(_dumps_bytes(obj), status=status, mimetype="application/json")
+
+
+_PKG_DIR = Path(__file__).resolve().parent
+_PKG_PREFIX = str(_PKG_DIR) + os.sep
 
-_tts_client_lock = threading.Lock()
-_tts_client: Optional[OpenAI] = None
 _tts_format_warning_shown = False
 
 
-def load_config():
+def load_config() -> dict[str, Any]:
+    """Return the capture configuration; .env and the environment are read once per process."""
+    # Callers tweak their copy (e.g. --ui-host), so never hand out the cached dict.
+    return dict(_load_config_cached())
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config_cached() -> dict[str, Any]:
     load_dotenv()
     port_env = os.getenv("STREAM_UI_PORT") or os.getenv("WEB_APP_PORT")
     if port_env:
@@ -67,18 +161,30 @@ def load_config():
     cfg = {
         "interval": float(os.getenv("SCREENSHOT_INTERVAL_SECONDS", "2")),
         "app_name": os.getenv("CAPTURE_SOURCE", "RetroArch"),
+        "capture_backend": os.getenv("CAPTURE_BACKEND", "auto").strip().lower(),
+        "capture_max_edge": int(os.getenv("CAPTURE_MAX_EDGE", "1024")),
+        "capture_dhash_distance": int(os.getenv("CAPTURE_DHASH_DISTANCE", "3")),
+        "analysis_concurrency": int(os.getenv("ANALYSIS_CONCURRENCY", "1")),
+        "analysis_cache_size": int(os.getenv("ANALYSIS_CACHE_SIZE", "128")),
+        "analysis_cache_path": os.getenv("ANALYSIS_CACHE_PATH", str(_PKG_DIR / ".cache" / "analysis.sqlite3")),
+        "analysis_cache_ttl": float(os.getenv("ANALYSIS_CACHE_TTL", str(86400 * 30))),
+        "save_frames": os.getenv("SAVE_FRAMES", "1") not in {"0", "false", "False"},
         "model": os.getenv("MODEL", "gpt-5"),
         "api_key": os.getenv("OPENAI_API_KEY"),
         "base_url": os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1"),
-        "out_dir": Path(os.getenv("SCREENSHOTS_DIR", str(Path(__file__).resolve().parent / "static" / "images"))).resolve(),
+        "out_dir": Path(os.getenv("SCREENSHOTS_DIR", str(_PKG_DIR / "static" / "images"))).resolve(),
         "ui_host": os.getenv("STREAM_UI_HOST", "0.0.0.0"),
         "ui_port": ui_port,
+        "ui_certfile": os.getenv("STREAM_UI_CERTFILE") or None,
+        "ui_keyfile": os.getenv("STREAM_UI_KEYFILE") or None,
         "summary_interval": summary_interval,
-        "audio_dir": Path(os.getenv("SUMMARY_AUDIO_DIR", str(Path(__file__).resolve().parent / "static" / "audio"))).resolve(),
+        "audio_dir": Path(os.getenv("SUMMARY_AUDIO_DIR", str(_PKG_DIR / "static" / "audio"))).resolve(),
         "tts_model": os.getenv("SUMMARY_TTS_MODEL", "gpt-4o-mini-tts"),
         "tts_voice": os.getenv("SUMMARY_TTS_VOICE", "coral"),
         "tts_format": os.getenv("SUMMARY_TTS_FORMAT", "mp3"),
         "tts_enabled": os.getenv("SUMMARY_TTS_ENABLED", "1") not in {"0", "false", "False"},
+        "frame_log": os.getenv("FRAME_LOG_PATH", str(_PKG_DIR / ".cache" / "frames.jsonl")),
+        "verbose": os.getenv("VERBOSE", "") not in {"", "0", "false", "False"},
     }
     missing = [k for k in ("api_key",) if not cfg[k]]
     if missing:
@@ -101,112 +207,195 @@ def ensure_out_dir(path: Path, clear: bool = False) -> None:
             print(f"Failed to remove stale capture '{item}': {exc}")
 
 
-def list_all_windows() -> list[tuple[str, str]]:
+@functools.lru_cache(maxsize=None)
+def _which(program: str) -> Optional[str]:
+    return shutil.which(program)
+
+
+# screencapture only needs stdin closed; stdout/stderr stay on the parent's streams.
+_SPAWN_FILE_ACTIONS = [(os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0)]
+
+
+def screencapture_jpeg(out_path: str | Path, rect: tuple[int, int, int, int] | None) -> bool:
     """
-    Return a list of (process_name, window_name) for all visible windows.
-    Useful for debugging window detection issues.
+    Capture a region (x,y,w,h) if rect is provided; otherwise full screen.
+    Requires macOS 'screencapture' CLI. Spawned with posix_spawn and reaped with
+    waitpid, skipping the pipes and bookkeeping subprocess.run sets up per call.
     """
-    script = '''
-    tell application "System Events"
-        set windowList to {}
-        repeat with proc in (every process whose visible is true)
-            set procName to name of proc
-            try
-                repeat with win in (windows of proc)
-                    set winName to name of win
-                    set end of windowList to procName & " | " & winName
-                end repeat
-            end try
-        end repeat
-        return windowList
-    end tell
-    '''
+    exe = _which("screencapture")
+    if exe is None:
+        return False
+    if rect:
+        x, y, w, h = rect
+        argv = ["screencapture", "-x", "-t", "jpg", f"-R{x},{y},{w},{h}", str(out_path)]
+    else:
+        argv = ["screencapture", "-x", "-t", "jpg", str(out_path)]
     try:
-        result = subprocess.run([
-            "osascript", "-e", script
-        ], capture_output=True, text=True, check=True)
-        out = result.stdout.strip()
-        if not out:
-            return []
-        # Parse the list format from AppleScript
-        items = out.split(", ")
-        windows = []
-        for item in items:
-            if " | " in item:
-                parts = item.split(" | ", 1)
-                windows.append((parts[0].strip(), parts[1].strip()))
-        return windows
-    except Exception:
-        return []
+        pid = os.posix_spawn(exe, argv, os.environ, file_actions=_SPAWN_FILE_ACTIONS)
+        _, status = os.waitpid(pid, 0)
+        code = os.waitstatus_to_exitcode(status)
+        if code != 0:
+            print(f"Capture failed: screencapture exited with status {code}")
+            return False
+        return os.stat(out_path).st_size > 0
+    except Exception as exc:
+        print(f"Capture failed: {exc}")
+        return False
+
 
+_read_buffers = threading.local()
 
-def osascript_get_bounds(app_name: str) -> tuple[int, int, int, int] | None:
+
+def read_image_bytes(path: str | Path, reuse: bool = False) -> memoryview:
     """
-    Return (x, y, width, height) of the front window of app_name.
-    Uses AppleScript via osascript. Returns None if not available.
+    Read a file straight into a buffer sized from fstat, with no intermediate copies.
+    With reuse=True the bytes land in a per-thread buffer kept across calls, so a
+    capture loop allocates nothing per frame; the view is only valid until the same
+    thread's next reuse=True read.
     """
-    script = f'''
-    tell application "System Events"
-        if exists process "{app_name}" then
-            tell process "{app_name}"
-                if exists window 1 then
-                    set b to bounds of window 1
-                    return b
-                else
-                    return "NO_WINDOW"
-                end if
-            end tell
-        else
-            return "NO_PROCESS"
-        end if
-    end tell
-    '''
-    try:
-        result = subprocess.run([
-            "osascript", "-e", script
-        ], capture_output=True, text=True, check=True)
-        out = result.stdout.strip()
-        if out in ("NO_WINDOW", "NO_PROCESS", ""):
-            return None
-        # AppleScript bounds are: left, top, right, bottom
-        parts = [int(p.strip()) for p in out.replace("{", "").replace("}", "").split(",")]
-        if len(parts) != 4:
-            return None
-        left, top, right, bottom = parts
-        width = max(0, right - left)
-        height = max(0, bottom - top)
-        if width == 0 or height == 0:
-            return None
-        return left, top, width, height
-    except subprocess.CalledProcessError:
+    with open(path, "rb", buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        if reuse:
+            buf = getattr(_read_buffers, "buf", None)
+            if buf is None or len(buf) < size:
+                # Replace rather than grow: views of the old buffer may still be alive.
+                buf = _read_buffers.buf = bytearray(max(size, 1 << 20))
+        else:
+            buf = bytearray(size)
+        n = f.readinto(memoryview(buf)[:size])
+    return memoryview(buf)[:n]
+
+
+def encode_image_b64(path: Path) -> str:
+    # base64 output is pure ASCII, which decodes faster than UTF-8.
+    return _b64encode_str(read_image_bytes(path, reuse=True))
+
+
+_JPEG_QUALITY = 85
+
+if xxhash is not None:
+    _frame_digest = xxhash.xxh3_64_intdigest
+else:  # pragma: no cover - stdlib fallback
+    def _frame_digest(data: bytes | memoryview) -> int:
+        return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+def frame_dhash(data: bytes | memoryview) -> int | None:
+    """
+    64-bit difference hash of a JPEG frame: one bit per horizontally adjacent pixel
+    pair of a 9x8 grayscale thumbnail. Unlike a byte digest it survives JPEG noise
+    and tiny animations, so near-identical frames hash a few bits apart.
+    None when Pillow is missing or the bytes don't decode.
+    """
+    if Image is None:
         return None
+    try:
+        with Image.open(io.BytesIO(data)) as frame:
+            frame.draft("L", (72, 64))  # decode at reduced scale; only 9x8 is kept
+            pixels = frame.convert("L").resize((9, 8), Image.BILINEAR).tobytes()
     except Exception:
         return None
+    bits = 0
+    for row in range(0, 72, 9):
+        for i in range(row, row + 8):
+            bits = (bits << 1) | (pixels[i] > pixels[i + 1])
+    return bits
 
 
-def screencapture_png(out_path: Path, rect: tuple[int, int, int, int] | None) -> bool:
+def capture_stream_frame(capturer: SCKCapturer) -> bytes | None:
     """
-    Capture a region (x,y,w,h) if rect is provided; otherwise full screen.
-    Requires macOS 'screencapture' CLI.
+    Encode the capturer's latest frame as JPEG in memory, without a subprocess.
+
+    Runs on the capture-producer thread, so encoding frame N overlaps the model
+    call for frame N-1. Pillow releases the GIL while unpacking and encoding, so a
+    process pool would only add the cost of pickling every raw frame across.
     """
     try:
-        if rect:
-            x, y, w, h = rect
-            cmd = [
-                "screencapture", "-x", "-t", "png", f"-R{x},{y},{w},{h}", str(out_path),
-            ]
-        else:
-            cmd = ["screencapture", "-x", "-t", "png", str(out_path)]
-        subprocess.run(cmd, check=True)
-        return out_path.exists() and out_path.stat().st_size > 0
+        frame = capturer.latest_frame()
+        if frame is None:
+            return None
+        buf = io.BytesIO()
+        # JPEG is several times smaller and faster to encode than PNG for game frames.
+        frame.save(buf, "JPEG", quality=_JPEG_QUALITY, optimize=False)
+        return buf.getvalue()
     except Exception as exc:
         print(f"Capture failed: {exc}")
-        return False
+        return None
 
 
-def encode_image_b64(path: Path) -> str:
-    with open(path, "rb") as f:
-        return base64.b64encode(f.read()).decode("utf-8")
+def shrink_jpeg(data: bytes | memoryview, max_edge: int) -> bytes | memoryview:
+    """
+    Re-encode a screencapture JPEG so its longest side is at most max_edge pixels.
+    Retina captures are 2-4 MB at native size; upload time and image tokens scale
+    with that, while the model reads a 1024px frame just as well. Returns data
+    unchanged when Pillow is missing, max_edge is 0, or the frame is already small.
+    """
+    if Image is None or not max_edge:
+        return data
+    try:
+        with Image.open(io.BytesIO(data)) as frame:
+            width, height = frame.size
+            if max(width, height) <= max_edge:
+                return data
+            # draft() lets libjpeg decode at 1/2, 1/4 or 1/8 scale, so the full-size
+            # frame is never decompressed; thumbnail() then resamples the rest.
+            frame.draft("RGB", (max_edge, max_edge))
+            frame.thumbnail((max_edge, max_edge), Image.BILINEAR)
+            buf = io.BytesIO()
+            frame.convert("RGB").save(buf, "JPEG", quality=_JPEG_QUALITY, optimize=False)
+            return buf.getvalue()
+    except Exception as exc:
+        print(f"Downscale failed, sending full-size frame: {exc}")
+        return data
+
+
+# event loop -> (client, run config) for OPENAI_HTTP2; an AsyncOpenAI pool is bound
+# to the loop that opened its connections, so every loop gets a client of its own.
+_loop_openai: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, tuple[AsyncOpenAI, RunConfig]]" = (
+    weakref.WeakKeyDictionary()
+)
+_loop_openai_lock = threading.Lock()
+_http2_unavailable = False  # set once httpx turns out to lack the h2 extra
+
+
+def _loop_openai_entry(loop: asyncio.AbstractEventLoop) -> Optional[tuple[AsyncOpenAI, RunConfig]]:
+    """
+    With OPENAI_HTTP2=1, this loop's AsyncOpenAI on an HTTP/2 pool plus a RunConfig
+    that routes agent runs through it, so concurrent analyses, summaries and speech
+    on the loop multiplex over one TLS connection. None (the SDK's own pool) when unset.
+    """
+    global _http2_unavailable
+    if os.getenv("OPENAI_HTTP2") != "1" or _http2_unavailable:
+        return None
+    with _loop_openai_lock:
+        entry = _loop_openai.get(loop)
+        if entry is None:
+            kwargs = _openai_client_kwargs(
+                {"api_key": os.getenv("OPENAI_API_KEY"), "base_url": os.getenv("OPENAI_BASE_URL")}
+            )
+            try:
+                # openai's wrapper keeps its own timeout and pool limits; only HTTP/2 is added.
+                client = AsyncOpenAI(http_client=DefaultAsyncHttpxClient(http2=True), **kwargs)
+            except ImportError:  # pragma: no cover - httpx without the h2 extra
+                print("OPENAI_HTTP2=1 ignored: install httpx[http2]", file=sys.stderr)
+                _http2_unavailable = True
+                return None
+            entry = _loop_openai[loop] = (client, RunConfig(model_provider=MultiProvider(openai_client=client)))
+        return entry
+
+
+def _run_config() -> Optional[RunConfig]:
+    """RunConfig for agent runs on the running loop; None means SDK defaults."""
+    entry = _loop_openai_entry(asyncio.get_running_loop())
+    return entry[1] if entry is not None else None
+
+
+async def _close_loop_openai() -> None:
+    """Close the running loop's OPENAI_HTTP2 client, if one was opened."""
+    with _loop_openai_lock:
+        entry = _loop_openai.pop(asyncio.get_running_loop(), None)
+    if entry is not None:
+        await entry[0].close()
 
 
 def build_agents(model_name: str) -> tuple[Agent, Agent]:
@@ -318,30 +507,13 @@ def build_chat_agent(model_name: str) -> Agent:
     )
 
 
-def process_chat_message(agent: Agent, message: str) -> str:
-    """Process a chat message using the PokéAPI agent."""
-    def _run_sync() -> Any:
-        return Runner.run_sync(
-            agent,
-            input=message,
-        )
-
-    try:
-        run = _run_sync()
-    except RuntimeError as exc:
-        error_text = str(exc).lower()
-        if "no current event loop" not in error_text and "event loop is closed" not in error_text:
-            raise
-        loop = asyncio.new_event_loop()
-        try:
-            asyncio.set_event_loop(loop)
-            run = _run_sync()
-        finally:
-            asyncio.set_event_loop(None)
-            loop.close()
+async def process_chat_message_async(agent: Agent, message: str) -> str:
+    """Process a chat message on the caller's event loop (for async web apps)."""
+    run = await Runner.run(agent, input=message, run_config=_run_config())
     return extract_final_output(run)
 
 
+@functools.lru_cache(maxsize=1)
 def build_analysis_prompt() -> str:
     """Return the base analysis prompt for frame evaluation."""
     return (
@@ -368,33 +540,31 @@ def _emit(handlers: Iterable[Callable[[dict[str, Any]], None]], payload: dict[st
             print(f"Callback error: {exc}", file=sys.stderr)
 
 
-def _relative_image_path(path: Path) -> str:
-    return _relative_static_path(path)
+def _fmt_compact(now: datetime) -> str:
+    """YYYYmmdd_HHMMSS for file names; plain integer formatting skips strftime's locale path."""
+    return f"{now.year:04d}{now.month:02d}{now.day:02d}_{now.hour:02d}{now.minute:02d}{now.second:02d}"
+
+
+def _relative_image_path(path: Optional[str | Path]) -> Optional[str]:
+    # None when SAVE_FRAMES=0 left nothing on disk to point at.
+    return _relative_static_path(path) if path else None
 
 
-def _relative_static_path(path: Path) -> str:
+def _discard_file(path: str) -> None:
     try:
-        rel = path.relative_to(Path(__file__).resolve().parent)
-        return str(rel).replace(os.sep, "/")
-    except ValueError:
-        return str(path)
-
-
-def _get_tts_client(api_key: Optional[str], base_url: Optional[str]) -> Optional[OpenAI]:
-    global _tts_client
-    with _tts_client_lock:
-        if _tts_client is None:
-            client_kwargs: Dict[str, Any] = {}
-            if api_key:
-                client_kwargs["api_key"] = api_key
-            if base_url:
-                client_kwargs["base_url"] = base_url
-            try:
-                _tts_client = OpenAI(**client_kwargs)
-            except Exception as exc:  # pragma: no cover
-                print(f"Failed to initialize OpenAI audio client: {exc}", file=sys.stderr)
-                return None
-        return _tts_client
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _relative_static_path(path: str | Path) -> str:
+    # A prefix check on the string; out_dir/audio_dir are already resolved, so this
+    # matches Path.relative_to without building Path objects per payload.
+    path = os.fspath(path)
+    if not path.startswith(_PKG_PREFIX):
+        return path
+    rel = path[len(_PKG_PREFIX):]
+    return rel.replace(os.sep, "/") if os.sep != "/" else rel
 
 
 def _warn_tts_format(detected: str, fallback: str) -> None:
@@ -405,18 +575,23 @@ def _warn_tts_format(detected: str, fallback: str) -> None:
     _tts_format_warning_shown = True
 
 
-def synthesize_summary_audio(summary_text: str, cfg: dict[str, Any]) -> Optional[str]:
-    """Generate a speech file for the provided summary text and return a static-relative path."""
+def _openai_client_kwargs(cfg: dict[str, Any]) -> Dict[str, Any]:
+    client_kwargs: Dict[str, Any] = {}
+    if cfg.get("api_key"):
+        client_kwargs["api_key"] = cfg["api_key"]
+    if cfg.get("base_url"):
+        client_kwargs["base_url"] = cfg["base_url"]
+    return client_kwargs
+
+
+def _tts_request(summary_text: str, cfg: dict[str, Any]) -> Optional[tuple[Path, Dict[str, Any]]]:
+    """Return (output path, speech request args) for summary_text, or None when TTS is off."""
     if not summary_text or not summary_text.strip():
         return None
 
     if not cfg.get("tts_enabled", True):
         return None
 
-    client = _get_tts_client(cfg.get("api_key"), cfg.get("base_url"))
-    if client is None:
-        return None
-
     audio_dir = Path(cfg.get("audio_dir"))
     ensure_out_dir(audio_dir, clear=False)
 
@@ -424,18 +599,32 @@ def synthesize_summary_audio(summary_text: str, cfg: dict[str, Any]) -> Optional
     extension = "mp3"
     if requested_format != "mp3":
         _warn_tts_format(requested_format, extension)
-    filename = f"summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}.{extension}"
-    out_path = audio_dir / filename
+    filename = f"summary_{_fmt_compact(datetime.now())}_{uuid.uuid4().hex[:8]}.{extension}"
 
     request_args: Dict[str, Any] = {
         "model": cfg.get("tts_model") or "gpt-4o-mini-tts",
         "voice": cfg.get("tts_voice") or "coral",
         "input": summary_text.strip(),
     }
+    return audio_dir / filename, request_args
+
+
+async def synthesize_summary_audio_async(
+    summary_text: str, cfg: dict[str, Any], client: Optional[AsyncOpenAI]
+) -> Optional[str]:
+    """
+    Generate a speech file for summary_text and return a static-relative path. The
+    response is streamed to disk as it arrives instead of parking a worker thread on it.
+    An AsyncOpenAI client is bound to the loop that uses it, so callers own it.
+    """
+    request = _tts_request(summary_text, cfg) if client is not None else None
+    if request is None:
+        return None
 
+    out_path, request_args = request
     try:
-        with client.audio.speech.with_streaming_response.create(**request_args) as response:
-            response.stream_to_file(out_path)
+        async with client.audio.speech.with_streaming_response.create(**request_args) as response:
+            await response.stream_to_file(out_path)
     except Exception as exc:  # pragma: no cover
         print(f"Failed to synthesize summary audio: {exc}", file=sys.stderr)
         return None
@@ -443,13 +632,18 @@ def synthesize_summary_audio(summary_text: str, cfg: dict[str, Any]) -> Optional
     return _relative_static_path(out_path)
 
 
-def _default_analysis_handler(payload: dict[str, Any]) -> None:
+def _default_analysis_handler(payload: dict[str, Any], verbose: bool = False) -> None:
     if payload.get("type") != "analysis":
         return
 
     timestamp = payload.get("timestamp", "")
-    data = payload.get("data") or {}
-    print(f"[{timestamp}] Frame Analysis:\n{json.dumps(data, indent=2)}\n")
+    if verbose:
+        # The full frame JSON is in the frame log; pretty-printing it is opt-in.
+        data = payload.get("data") or {}
+        print(f"[{timestamp}] Frame Analysis:\n{_dumps_indented(data)}\n")
+    else:
+        scene = (payload.get("data") or {}).get("scene") or "unknown scene"
+        print(f"[{timestamp}] Frame Analysis: {scene}")
 
     meta = payload.get("meta") or {}
     battle_detected = str(meta.get("battle_detected", False)).lower()
@@ -497,6 +691,44 @@ def _default_summary_handler(payload: dict[str, Any]) -> None:
     print("=" * 60 + "\n")
 
 
+class FrameLog:
+    """
+    Append-only JSONL flight recorder of analysis and summary payloads, one compact
+    line each. Writes land in a 64 KiB buffer that is flushed on every summary and
+    on close, so the frame loop never waits on the disk or the stdout lock.
+    """
+
+    _TYPES = frozenset({"analysis", "summary"})
+
+    def __init__(self, path: str | Path) -> None:
+        os.makedirs(os.path.dirname(os.fspath(path)) or ".", exist_ok=True)
+        self._fp = open(path, "ab", buffering=1 << 16)
+        atexit.register(self.close)
+
+    def write(self, payload: dict[str, Any]) -> None:
+        kind = payload.get("type")
+        if kind not in self._TYPES or self._fp.closed:
+            return
+        self._fp.write(_dumps_bytes(payload) + b"\n")
+        if kind == "summary":
+            self._fp.flush()
+
+    def close(self) -> None:
+        if not self._fp.closed:
+            self._fp.close()
+
+
+def open_frame_log(path: Optional[str | Path]) -> Optional[FrameLog]:
+    """Open the frame log at path; None when disabled (empty path) or unwritable."""
+    if not path:
+        return None
+    try:
+        return FrameLog(path)
+    except OSError as exc:
+        print(f"Frame log disabled, cannot open '{path}': {exc}")
+        return None
+
+
 def _default_error_handler(payload: dict[str, Any]) -> None:
     message = payload.get("message", "Analysis error")
     timestamp = payload.get("timestamp")
@@ -509,53 +741,187 @@ def _default_error_handler(payload: dict[str, Any]) -> None:
 
 
 class BroadcastChannel:
-    """Lightweight pub/sub channel backed by per-subscriber queues."""
+    """
+    Lightweight pub/sub channel backed by one bounded ring shared by all subscribers.
+    Each subscriber only holds a cursor (the sequence number of the next event it
+    wants), so publishing is a single append regardless of subscriber count. A
+    subscriber more than `maxlen` events behind skips the overwritten ones instead
+    of back-pressuring the capture thread. Payloads are serialised once on publish,
+    not once per subscriber.
+
+    Async subscribers on the same event loop share one wake-up future, so a publish
+    from the capture thread costs one `call_soon_threadsafe` per loop, not per viewer.
+
+    Live previews (`publish_live`) bypass the ring: one slot holds only the newest, so
+    they never evict events a reconnecting client may resume from, and the next ring
+    event clears it.
+    """
 
-    def __init__(self) -> None:
-        self._lock = threading.Lock()
-        self._subscribers: list[queue.Queue[Dict[str, Any]]] = []
+    def __init__(self, maxlen: int = 64) -> None:
+        self._cond = threading.Condition()
+        self._events: deque[tuple[Optional[str], str]] = deque(maxlen=maxlen)
+        self._next_seq = 0
+        self._live: Optional[tuple[Optional[str], str]] = None
+        self._live_seq = 0
+        self._loop_wakeups: dict[asyncio.AbstractEventLoop, asyncio.Future] = {}
+
+    def subscribe(self) -> int:
+        """Return a cursor that receives events published from now on."""
+        # A single attribute read is atomic, so joining never contends with publish.
+        return self._next_seq
+
+    def publish(self, payload: Dict[str, Any], event: Optional[str] = None) -> None:
+        """Broadcast payload; a named event only reaches clients listening for that name."""
+        entry = (event, _dumps(payload))
+        with self._cond:
+            self._events.append(entry)
+            self._next_seq += 1
+            self._live = None  # a resumable event supersedes any live preview
+            self._cond.notify_all()
+            wakeups, self._loop_wakeups = self._loop_wakeups, {}
+        self._wake(wakeups)
+
+    def publish_live(self, payload: Dict[str, Any], event: Optional[str] = None) -> None:
+        """Replace the live preview; subscribers get the newest one, without an event id."""
+        entry = (event, _dumps(payload))
+        with self._cond:
+            self._live = entry
+            self._live_seq += 1
+            self._cond.notify_all()
+            wakeups, self._loop_wakeups = self._loop_wakeups, {}
+        self._wake(wakeups)
+
+    @staticmethod
+    def _wake(wakeups: dict[asyncio.AbstractEventLoop, asyncio.Future]) -> None:
+        for loop, future in wakeups.items():
+            try:
+                loop.call_soon_threadsafe(_resolve_wakeup, future)
+            except RuntimeError:  # loop already closed
+                pass
 
-    def subscribe(self) -> queue.Queue[Dict[str, Any]]:
-        subscriber: queue.Queue[Dict[str, Any]] = queue.Queue()
-        with self._lock:
-            self._subscribers.append(subscriber)
-        return subscriber
+    def wait(self, cursor: int, timeout: Optional[float] = None) -> tuple[int, list[tuple[Optional[str], str]]]:
+        """Block until events past cursor exist; return the advanced cursor and (event, JSON) pairs."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._next_seq > cursor, timeout):
+                return cursor, []
+            return self._drain(cursor)
+
+    async def wait_async(
+        self, cursor: int, timeout: Optional[float] = None
+    ) -> tuple[int, list[tuple[Optional[str], str]]]:
+        """`wait` for coroutines: suspends the subscriber instead of blocking a thread."""
+        cursor, events, _, _ = await self.wait_live_async(cursor, None, timeout)
+        return cursor, events
+
+    async def wait_live_async(
+        self, cursor: int, live_seen: Optional[int], timeout: Optional[float] = None
+    ) -> tuple[int, list[tuple[Optional[str], str]], Optional[int], Optional[tuple[Optional[str], str]]]:
+        """
+        `wait_async` that also wakes for live previews newer than live_seen (None
+        ignores them). Returns (cursor, events, live_seen, live preview or None).
+        """
+        loop = asyncio.get_running_loop()
+        with self._cond:
+            if self._has_news(cursor, live_seen):
+                return self._drain_live(cursor, live_seen)
+            future = self._loop_wakeups.get(loop)
+            if future is None:
+                future = self._loop_wakeups[loop] = loop.create_future()
+        try:
+            # shield: a subscriber timing out must not cancel its neighbours' wake-up.
+            await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            return cursor, [], live_seen, None
+        with self._cond:
+            return self._drain_live(cursor, live_seen)
+
+    def _has_news(self, cursor: int, live_seen: Optional[int]) -> bool:
+        return self._next_seq > cursor or (
+            live_seen is not None and self._live is not None and self._live_seq > live_seen
+        )
+
+    def _drain_live(
+        self, cursor: int, live_seen: Optional[int]
+    ) -> tuple[int, list[tuple[Optional[str], str]], Optional[int], Optional[tuple[Optional[str], str]]]:
+        cursor, events = self._drain(cursor)
+        if live_seen is None:
+            return cursor, events, None, None
+        live = self._live if self._live_seq > live_seen else None
+        return cursor, events, self._live_seq, live
+
+    def _drain(self, cursor: int) -> tuple[int, list[tuple[Optional[str], str]]]:
+        oldest = self._next_seq - len(self._events)
+        return self._next_seq, list(islice(self._events, max(cursor, oldest) - oldest, None))
+
+    def resume_cursor(self, last_event_id: Optional[str]) -> int:
+        """Cursor for an EventSource reconnect carrying Last-Event-ID, else `subscribe()`."""
+        try:
+            seq = int(last_event_id) + 1 if last_event_id else None
+        except ValueError:
+            seq = None
+        # Ids from a previous server run may be ahead of this one; start fresh then.
+        if seq is None or seq > self._next_seq:
+            return self.subscribe()
+        return seq
 
-    def unsubscribe(self, subscriber: queue.Queue[Dict[str, Any]]) -> None:
-        with self._lock:
-            if subscriber in self._subscribers:
-                self._subscribers.remove(subscriber)
 
-    def publish(self, payload: Dict[str, Any]) -> None:
-        with self._lock:
-            subscribers = list(self._subscribers)
-        for subscriber in subscribers:
-            subscriber.put(payload)
+def _resolve_wakeup(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
 
 
 analysis_channel = BroadcastChannel()
 summary_channel = BroadcastChannel()
-_capture_thread: threading.Thread | None = None
+_capture_process: Any = None  # multiprocessing.Process of the capture worker
+_capture_events: Any = None  # multiprocessing.Queue of (kind, payload) from the worker
+_capture_running = threading.Event()  # set while the worker is alive
 _capture_lock = threading.Lock()
 
 
-def _event_response(channel: BroadcastChannel) -> Response:
-    def generator() -> Any:
-        q = channel.subscribe()
-        try:
-            while True:
-                try:
-                    payload = q.get(timeout=10)
-                except queue.Empty:
-                    yield ": keep-alive\n\n"
-                    continue
-                yield f"data: {json.dumps(payload)}\n\n"
-        finally:
-            channel.unsubscribe(q)
+_SSE_KEEPALIVE_SECONDS = 15.0
 
-    response = Response(stream_with_context(generator()), mimetype="text/event-stream")
-    response.headers["Cache-Control"] = "no-cache"
+
+def _sse_frame(data: str, event_id: Optional[int] = None, event: Optional[str] = None) -> str:
+    """Frame one Server-Sent Event; `data` is single-line JSON."""
+    head = ""
+    if event is not None:
+        head += f"event: {event}\n"
+    if event_id is not None:
+        head += f"id: {event_id}\n"
+    return f"{head}data: {data}\n\n"
+
+
+def _event_response(channel: BroadcastChannel) -> Response:
+    cursor = channel.resume_cursor(request.headers.get("Last-Event-ID"))
+
+    async def generator() -> Any:
+        nonlocal cursor
+        # 0: a client joining mid-recap still gets the current preview.
+        live_seen = 0
+        while True:
+            cursor, events, live_seen, live = await channel.wait_live_async(
+                cursor, live_seen, timeout=_SSE_KEEPALIVE_SECONDS
+            )
+            if not events and live is None:
+                yield ": keep-alive\n\n"
+                continue
+            first_id = cursor - len(events)
+            frames = [
+                _sse_frame(payload_json, first_id + offset, event)
+                for offset, (event, payload_json) in enumerate(events)
+            ]
+            if live is not None:
+                # No id: previews must not move the client's Last-Event-ID.
+                frames.append(_sse_frame(live[1], None, live[0]))
+            yield "".join(frames)
+
+    response = Response(generator(), mimetype="text/event-stream")
+    # no-transform stops proxies from compressing (and so buffering) the stream;
+    # X-Accel-Buffering does the same for nginx.
+    response.headers["Cache-Control"] = "no-cache, no-transform"
     response.headers["X-Accel-Buffering"] = "no"
+    # Streams stay open indefinitely; Quart's default response timeout would cut them.
+    response.timeout = None
     return response
 
 def extract_final_output(run_result) -> str:
@@ -571,28 +937,88 @@ def extract_final_output(run_result) -> str:
     return ""
 
 
-def analyze_image(agent: Agent, image_path: Path, prompt: str) -> str:
+# A ```json fenced block; an unterminated fence runs to the end of the reply.
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)(?:```|\Z)", re.DOTALL)
+
+
+# json.JSONDecodeError and orjson.JSONDecodeError subclass ValueError; msgspec's don't.
+_DECODE_ERRORS = (ValueError, msgspec.DecodeError)
+
+
+def extract_json(content: str, decode: Callable[[str], Any] = _loads) -> Any:
+    """
+    Parse a model reply as JSON, falling back to its first fenced block, then to the
+    outermost {...} span (for prose-wrapped, unfenced replies). None if none parse.
+    Pass a typed decoder (e.g. a msgspec Decoder's decode) to validate while parsing.
+    """
+    try:
+        return decode(content)
+    except _DECODE_ERRORS:
+        pass
+    match = _FENCE_RE.search(content)
+    if match is not None:
+        try:
+            return decode(match.group(1))
+        except _DECODE_ERRORS:
+            pass
+    # find/rfind scan in C without a backtracking regex over the whole reply.
+    start = content.find("{")
+    end = content.rfind("}")
+    if start == -1 or end < start or (start == 0 and end == len(content) - 1):
+        return None
+    try:
+        return decode(content[start : end + 1])
+    except _DECODE_ERRORS:
+        return None
+
+
+# (parsed reply, typed view of the fields the capture loop reads)
+ParsedAnalysis = tuple[dict[str, Any], AnalysisFrame]
+
+
+def parse_analysis(content: str) -> Optional[ParsedAnalysis]:
+    """
+    Parse a frame-analysis reply. The dict is published as-is, unknown keys and
+    nulls included; only a reply that is not a JSON object is rejected.
+    """
+    data = extract_json(content)
+    if not isinstance(data, dict):
+        return None
+    return data, analysis_view(data)
+
+
+@functools.lru_cache(maxsize=4)
+def _prompt_item(prompt: str) -> dict[str, str]:
+    # The prompt is the same every frame; the SDK copies input items before use,
+    # so one shared dict is safe to hand to every run.
+    return {"type": "input_text", "text": prompt}
+
+
+# Every capture backend hands the loop JPEG bytes.
+_JPEG_DATA_URL_PREFIX = "data:image/jpeg;base64,"
+
+
+def _image_input(b64: str, prompt: str) -> list[dict[str, Any]]:
     # Use structured multimodal content so the image is not tokenized as text.
     # This adheres to Agents SDK/Responses input item guidelines.
-    b64 = encode_image_b64(image_path)
-    user_message = {
-        "role": "user",
-        "content": [
-            {"type": "input_text", "text": prompt},
-            {"type": "input_image", "image_url": f"data:image/png;base64,{b64}", "detail": "high"},
-        ],
-    }
+    return [
+        {
+            "role": "user",
+            "content": [
+                _prompt_item(prompt),
+                {"type": "input_image", "image_url": _JPEG_DATA_URL_PREFIX + b64, "detail": "high"},
+            ],
+        }
+    ]
 
-    run = Runner.run_sync(
-        agent,
-        input=[user_message],
-    )
-    return extract_final_output(run)
 
+async def analyze_image_async(agent: Agent, b64: str, prompt: str) -> str:
+    """Analyse one frame on the capture loop's event loop."""
+    run = await Runner.run(agent, input=_image_input(b64, prompt), run_config=_run_config())
+    return extract_final_output(run)
 
-def generate_summary(agent: Agent, analyses: list[dict], previous_summary: str = "") -> str:
-    """Generate or update a cumulative summary based on new analyses."""
 
+def _summary_prompt(analyses: list[dict], previous_summary: str) -> str:
     latest_count = len(analyses)
     prompt_parts: list[str] = [
         "You are maintaining a cumulative summary of an ongoing Pokémon gameplay session.",
@@ -605,27 +1031,221 @@ def generate_summary(agent: Agent, analyses: list[dict], previous_summary: str =
         prompt_parts.append("Current cumulative summary: (none yet – begin one now.)")
 
     prompt_parts.append(f"New frame analyses to integrate ({latest_count}):")
-    for i, analysis in enumerate(analyses, 1):
-        prompt_parts.append(f"Frame +{i}:\n{json.dumps(analysis, indent=2)}")
+    # Join the frame blocks as bytes and decode once instead of once per frame.
+    prompt_parts.append(
+        b"\n\n".join(
+            b"Frame +%d:\n%s" % (i, _dumps_indented_bytes(analysis))
+            for i, analysis in enumerate(analyses, 1)
+        ).decode("utf-8")
+    )
 
     prompt_parts.append(
         "Respond with the refreshed cumulative summary (3-4 sentences). "
         "Highlight major events, progress, battles, party updates, and notable location changes without repeating irrelevant details."
     )
 
-    summary_text = "\n\n".join(prompt_parts)
+    return "\n\n".join(prompt_parts)
+
+
+_SUMMARY_PREVIEW_INTERVAL = 0.25  # seconds between live summary previews
+
 
-    if latest_count == 0:
+async def generate_summary_streamed(
+    agent: Agent,
+    analyses: list[dict],
+    previous_summary: str = "",
+    on_text: Optional[Callable[[str], None]] = None,
+) -> str:
+    """
+    Generate or update the cumulative summary from new analyses, calling on_text with
+    the text generated so far as tokens arrive, at most every _SUMMARY_PREVIEW_INTERVAL seconds. Passing the whole prefix,
+    not the delta, means a listener that misses some updates still renders the right
+    text from the next one.
+    """
+
+    if not analyses:
         return previous_summary
 
-    run = Runner.run_sync(
-        agent,
-        input=summary_text,
+    result = Runner.run_streamed(
+        agent, input=_summary_prompt(analyses, previous_summary), run_config=_run_config()
     )
-    output = extract_final_output(run).strip()
+    parts: list[str] = []
+    last_sent = 0.0
+    async for event in result.stream_events():
+        if event.type == "raw_response_event" and isinstance(event.data, ResponseTextDeltaEvent):
+            parts.append(event.data.delta)
+            # Throttled: each update carries the whole prefix, so one per token would
+            # send O(n^2) bytes; the final summary payload follows regardless.
+            if on_text is not None and (now := time.monotonic()) - last_sent >= _SUMMARY_PREVIEW_INTERVAL:
+                last_sent = now
+                on_text("".join(parts))
+    output = extract_final_output(result).strip()
     return output or previous_summary
 
 
+def _dhash_within(a: int, b: int, distance: int) -> bool:
+    """True when two dHashes differ in at most `distance` of their 64 bits."""
+    return (a ^ b).bit_count() <= distance
+
+
+class FrameAnalysisCache:
+    """
+    Recent analyses keyed by frame, so returning to an already-analysed screen (a
+    menu, the overworld spot you left) reuses its analysis instead of a model call.
+    History is matched on exact bytes only: a 9x8 dHash cannot see HP bars or menu
+    text, so a near match against an older screen could replay stale state. The
+    `distance` tolerance applies to the most recently stored frame alone, the same
+    comparison the capture loop uses to skip near-identical frames. Bounded LRU.
+    """
+
+    def __init__(self, maxsize: int = 128, distance: int = 3) -> None:
+        self.maxsize = maxsize
+        self.distance = distance
+        self._by_digest: OrderedDict[int, tuple[str, ParsedAnalysis]] = OrderedDict()
+        self._last: Optional[tuple[int, tuple[str, ParsedAnalysis]]] = None
+
+    def get(self, digest: int, dhash: Optional[int]) -> Optional[tuple[str, ParsedAnalysis]]:
+        hit = self._by_digest.get(digest)
+        if hit is not None:
+            self._by_digest.move_to_end(digest)
+            return hit
+        if dhash is None or not self.distance or self._last is None:
+            return None
+        last_dhash, value = self._last
+        return value if _dhash_within(last_dhash, dhash, self.distance) else None
+
+    def put(self, digest: int, dhash: Optional[int], value: tuple[str, ParsedAnalysis]) -> None:
+        self._by_digest[digest] = value
+        self._by_digest.move_to_end(digest)
+        if len(self._by_digest) > self.maxsize:
+            self._by_digest.popitem(last=False)
+        self._last = (dhash, value) if dhash is not None else None
+
+
+# (captured_at, image base64, saved path or None, byte digest, dHash or None)
+CapturedFrame = tuple[str, str, Optional[str], int, Optional[int]]
+
+
+class FrameRing:
+    """Hold the newest captured frames; the consumer always takes the latest one."""
+
+    def __init__(self, maxlen: int = 2) -> None:
+        self._frames: deque[CapturedFrame] = deque(maxlen=maxlen)
+        self._cond = threading.Condition()
+        self._pushed = 0
+        self._taken = 0
+
+    def push(self, frame: CapturedFrame) -> None:
+        with self._cond:
+            self._frames.append(frame)
+            self._pushed += 1
+            self._cond.notify_all()
+
+    def get_latest_blocking(self, timeout: Optional[float] = None) -> Optional[CapturedFrame]:
+        """Wait for a frame newer than the last one taken; older unread frames are skipped."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._pushed != self._taken, timeout):
+                return None
+            self._taken = self._pushed
+            return self._frames[-1]
+
+
+def _capture_producer(
+    cfg: dict[str, Any],
+    capturer: Optional[SCKCapturer],
+    ring: FrameRing,
+    handlers_error: list[Callable[[dict[str, Any]], None]],
+    stop_event: threading.Event,
+) -> None:
+    """Capture every cfg["interval"] seconds regardless of how long analysis takes."""
+
+    out_dir = str(cfg["out_dir"])
+    max_edge = cfg.get("capture_max_edge", 1024)
+    first = True
+    refresh_bounds = False
+    last_digest: int | None = None
+    last_dhash: int | None = None
+    dhash_distance = cfg.get("capture_dhash_distance", 3)
+    save_frames = cfg.get("save_frames", True)
+    verbose = cfg.get("verbose", False)
+    next_due = time.monotonic()
+    while not stop_event.is_set():
+        # One clock read per frame names the file and stamps whatever payload it yields.
+        captured_at = datetime.now()
+        captured_ts = captured_at.isoformat(timespec="seconds")
+        out_path = os.path.join(out_dir, f"retroarch_{_fmt_compact(captured_at)}.jpg")
+
+        if capturer is not None:
+            image = capture_stream_frame(capturer)
+        else:
+            # None -> full screen; a missing window is retried on the next refresh.
+            bounds = get_bounds_cached(cfg["app_name"], refresh=refresh_bounds)
+            if bounds is None:
+                if first:
+                    print(f"WARNING: '{cfg['app_name']}' window not found, falling back to full screen capture.")
+                    print(f"Run 'python test_window_detection.py' to troubleshoot.\n")
+            else:
+                if first:
+                    x, y, w, h = bounds
+                    print(f"✓ Detected '{cfg['app_name']}' window: {w}x{h} at ({x}, {y})\n")
+
+            # The reused buffer is safe here: each frame is encoded before the next read.
+            image = read_image_bytes(out_path, reuse=True) if screencapture_jpeg(out_path, bounds) else None
+            refresh_bounds = image is None
+        first = False
+
+        if image is None:
+            _emit(
+                handlers_error,
+                {
+                    "type": "analysis_error",
+                    "timestamp": captured_ts,
+                    "message": "Screenshot failed; retrying after interval...",
+                    "image_path": _relative_image_path(out_path),
+                },
+            )
+        else:
+            digest = _frame_digest(image)
+            # Only hash frames whose bytes changed; identical ones are repeats already.
+            dhash = frame_dhash(image) if dhash_distance and digest != last_digest else None
+            repeat = digest == last_digest or (
+                dhash is not None
+                and last_dhash is not None
+                and _dhash_within(dhash, last_dhash, dhash_distance)
+            )
+            last_digest = digest
+            if repeat:
+                # Paused or static screens (menus, dialog boxes, idle animations) skip
+                # the model call, and the duplicate file, until the picture changes.
+                if capturer is None:
+                    _discard_file(out_path)
+            else:
+                # Compared against the last analysed frame, so slow drift still registers.
+                last_dhash = dhash
+                if capturer is None:
+                    # SCK frames arrive pre-scaled; CLI captures are native size. The file
+                    # on disk keeps full resolution for the dashboard.
+                    image = shrink_jpeg(image, max_edge)
+                    if not save_frames:
+                        _discard_file(out_path)  # the bytes are already in memory
+                if capturer is not None and save_frames:
+                    # The model gets the in-memory bytes; this copy only backs the payload's
+                    # image_path. Write it before queueing: a cache hit publishes that
+                    # path without waiting on a model call.
+                    with open(out_path, "wb") as f:
+                        f.write(image)
+                ring.push((captured_ts, _b64encode_str(image), out_path if save_frames else None, digest, dhash))
+
+        # Keep a steady cadence, but don't try to catch up after a slow capture.
+        next_due += cfg["interval"]
+        now = time.monotonic()
+        if next_due < now:
+            if verbose and now - next_due >= cfg["interval"]:
+                print(f"Capture fell behind by {now - next_due:.2f}s; skipping missed ticks.")
+            next_due = now
+        stop_event.wait(next_due - time.monotonic())
+
+
 def run_capture_loop(
     cfg: dict[str, Any],
     analysis_agent: Agent,
@@ -639,185 +1259,335 @@ def run_capture_loop(
 ) -> None:
     """Run the continuous capture loop, emitting payloads via the provided handlers."""
 
-    handlers_analysis = list(analysis_handlers) if analysis_handlers else [_default_analysis_handler]
+    asyncio.run(
+        run_capture_loop_async(
+            cfg,
+            analysis_agent,
+            summary_agent,
+            prompt,
+            analysis_handlers=analysis_handlers,
+            summary_handlers=summary_handlers,
+            error_handlers=error_handlers,
+            stop_event=stop_event,
+        )
+    )
+
+
+async def run_capture_loop_async(
+    cfg: dict[str, Any],
+    analysis_agent: Agent,
+    summary_agent: Agent,
+    prompt: str,
+    *,
+    analysis_handlers: Optional[Iterable[Callable[[dict[str, Any]], None]]] = None,
+    summary_handlers: Optional[Iterable[Callable[[dict[str, Any]], None]]] = None,
+    error_handlers: Optional[Iterable[Callable[[dict[str, Any]], None]]] = None,
+    stop_event: Optional[Any] = None,
+) -> None:
+    """
+    The capture loop as a coroutine: model and speech calls are awaited on this loop
+    (Runner.run, AsyncOpenAI), and blocking frame waits are pushed to a worker thread.
+    """
+
+    handlers_analysis = (
+        list(analysis_handlers)
+        if analysis_handlers
+        else [functools.partial(_default_analysis_handler, verbose=cfg.get("verbose", False))]
+    )
     handlers_summary = list(summary_handlers) if summary_handlers else [_default_summary_handler]
     handlers_error = list(error_handlers) if error_handlers else [_default_error_handler]
 
+    frame_log = open_frame_log(cfg.get("frame_log"))
+    if frame_log is not None:
+        handlers_analysis.append(frame_log.write)
+        handlers_summary.append(frame_log.write)
+
     summary_interval = int(cfg.get("summary_interval", 5) or 5)
     if summary_interval <= 0:
         summary_interval = 5
 
-    recent_analyses: list[dict[str, Any]] = []
+    # Only analyses not yet folded into the cumulative summary are kept. The bound
+    # stops a run of failing summaries from growing it for the whole session.
+    unsummarized: deque[dict[str, Any]] = deque(maxlen=summary_interval * 4)
     capture_count = 0
     cumulative_summary = ""
-    last_summary_len = 0
 
     ensure_out_dir(cfg["audio_dir"], clear=False)
 
-    while True:
-        if stop_event is not None and hasattr(stop_event, "is_set"):
+    # Speech shares this loop's OPENAI_HTTP2 client when there is one; otherwise it
+    # gets its own, created here because an AsyncOpenAI pool belongs to one loop.
+    loop_openai = _loop_openai_entry(asyncio.get_running_loop())
+    tts_client: Optional[AsyncOpenAI] = None
+    if cfg.get("tts_enabled", True):
+        tts_client = loop_openai[0] if loop_openai is not None else None
+        if tts_client is None:
             try:
-                if stop_event.is_set():
-                    break
-            except Exception:  # pragma: no cover
-                pass
+                tts_client = AsyncOpenAI(**_openai_client_kwargs(cfg))
+            except Exception as exc:  # pragma: no cover
+                print(f"Failed to initialize OpenAI audio client: {exc}", file=sys.stderr)
 
-        now = datetime.now().strftime("%Y%m%d_%H%M%S")
-        out_path = cfg["out_dir"] / f"retroarch_{now}.png"
+    # One long-lived ScreenCaptureKit stream replaces a screencapture fork per frame.
+    capturer = None
+    if cfg.get("capture_backend", "auto") != "screencapture":
+        capturer = start_capturer(cfg["app_name"], cfg["interval"], cfg.get("capture_max_edge", 1024))
+        if capturer is not None:
+            print(f"✓ Streaming '{cfg['app_name']}' via ScreenCaptureKit: {capturer.width}x{capturer.height}\n")
+
+    # Capture runs on its own thread so frames keep arriving during slow model calls;
+    # each analysis picks up the freshest frame and intermediate ones are dropped.
+    ring = FrameRing(maxlen=2)
+    producer_stop = threading.Event()
+    producer = threading.Thread(
+        target=_capture_producer,
+        args=(cfg, capturer, ring, handlers_error, producer_stop),
+        name="capture-producer",
+        daemon=True,
+    )
+    producer.start()
 
-        bounds = osascript_get_bounds(cfg["app_name"])  # None -> full screen
-        if bounds is None:
-            if capture_count == 0:
-                print(f"WARNING: '{cfg['app_name']}' window not found, falling back to full screen capture.")
-                print(f"Run 'python test_window_detection.py' to troubleshoot.\n")
-        else:
-            if capture_count == 0:
-                x, y, w, h = bounds
-                print(f"✓ Detected '{cfg['app_name']}' window: {w}x{h} at ({x}, {y})\n")
+    async def _summarize(new_entries: list[dict[str, Any]], capture_total: int) -> None:
+        # Runs as a task so summary + TTS round-trips don't hold up the next analysis.
+        nonlocal cumulative_summary
+        try:
+            def on_text(text: str) -> None:
+                # Live preview for the dashboard; the CLI handler ignores these.
+                _emit(handlers_summary, {"type": "summary_delta", "capture_total": capture_total, "text": text})
 
-        ok = screencapture_png(out_path, bounds)
-        if not ok:
-            _emit(
-                handlers_error,
-                {
-                    "type": "analysis_error",
-                    "timestamp": datetime.now().isoformat(timespec="seconds"),
-                    "message": "Screenshot failed; retrying after interval...",
-                    "image_path": _relative_image_path(out_path),
-                },
+            cumulative_summary = await generate_summary_streamed(
+                summary_agent, new_entries, cumulative_summary, on_text
             )
-            time.sleep(cfg["interval"])
-            continue
-
-        try:
-            content = analyze_image(analysis_agent, out_path, prompt)
+            summary_timestamp = datetime.now().isoformat(timespec="seconds")
+            summary_payload = {
+                "type": "summary",
+                "timestamp": summary_timestamp,
+                "summary": cumulative_summary,
+                "capture_total": capture_total,
+                "window": len(new_entries),
+                "delta": len(new_entries),
+                "interval": summary_interval,
+                "cumulative": True,
+            }
+            summary_audio = await synthesize_summary_audio_async(cumulative_summary, cfg, tts_client)
+            if summary_audio:
+                summary_payload["summary_audio"] = summary_audio
+            _emit(handlers_summary, summary_payload)
         except Exception as exc:
+            # Hand the entries back, ahead of anything analysed since, so the next
+            # summary still covers them. Refilling from the left end lets maxlen trim
+            # the oldest entries; extendleft would evict the newest instead.
+            merged = [*new_entries, *unsummarized]
+            unsummarized.clear()
+            unsummarized.extend(merged)
+            # Ends the live preview, so the dashboard drops its "Summarizing…" card.
+            _emit(handlers_summary, {"type": "summary_failed", "capture_total": capture_total})
             _emit(
                 handlers_error,
                 {
                     "type": "analysis_error",
                     "timestamp": datetime.now().isoformat(timespec="seconds"),
-                    "message": f"Analysis error: {exc}",
-                    "image_path": _relative_image_path(out_path),
+                    "message": f"Summary generation error: {exc}",
                 },
             )
-            time.sleep(cfg["interval"])
-            continue
 
-        data: dict[str, Any] | None = None
-        parsed_successfully = False
+    summary_task: asyncio.Task | None = None
+    analysis_concurrency = max(1, int(cfg.get("analysis_concurrency", 1) or 1))
+    cache_size = int(cfg.get("analysis_cache_size", 128) or 0)
+    analysis_cache = (
+        FrameAnalysisCache(cache_size, cfg.get("capture_dhash_distance", 3)) if cache_size > 0 else None
+    )
+    # Exact-hash tier on disk behind the in-memory one, so restarts start warm.
+    store_path = cfg.get("analysis_cache_path")
+    analysis_store = AnalysisStore(store_path, cfg.get("analysis_cache_ttl", 86400 * 30)) if store_path else None
+
+    async def _analysis_worker() -> None:
+        nonlocal capture_count, summary_task
 
-        try:
-            data = json.loads(content)
-            parsed_successfully = True
-        except json.JSONDecodeError:
-            content_stripped = content.strip()
-            if content_stripped.startswith("```"):
-                lines = content_stripped.split("\n")
-                json_lines: list[str] = []
-                in_json = False
-                for line in lines:
-                    if line.startswith("```"):
-                        if in_json:
-                            break
-                        in_json = True
-                        continue
-                    if in_json:
-                        json_lines.append(line)
+        while True:
+            if stop_event is not None and hasattr(stop_event, "is_set"):
                 try:
-                    data = json.loads("\n".join(json_lines))
-                    parsed_successfully = True
-                except json.JSONDecodeError:
-                    parsed_successfully = False
-
-        timestamp = datetime.now().isoformat(timespec="seconds")
-        image_relative = _relative_image_path(out_path)
-
-        if parsed_successfully and data is not None:
-            latest_calls = pull_latest_pokemon_calls()
-            scene_text = str(data.get("scene", "")).lower()
-            battle_detected = "battle" in scene_text
-            participants = [
-                str((ch or {}).get("name", "")).strip()
-                for ch in (data.get("characters") or [])
-                if str((ch or {}).get("name", "")).strip()
-            ]
-            call_names = {
-                str(name).lower()
-                for entry in latest_calls
-                for name in entry.get("names", [])
-            }
-            tool_called = bool(latest_calls)
-            stats_integrated = (
-                battle_detected
-                and bool(participants)
-                and all(name.lower() in call_names for name in participants)
-            )
+                    if stop_event.is_set():
+                        break
+                except Exception:  # pragma: no cover
+                    pass
+
+            frame = await asyncio.to_thread(ring.get_latest_blocking, 1.0)
+            if frame is None:
+                continue
+            # captured_ts comes from the clock read that named the file, so payloads,
+            # log lines and image_path all refer to the same instant.
+            captured_ts, image_b64, out_path, digest, dhash = frame
+
+            cached = analysis_cache.get(digest, dhash) if analysis_cache is not None else None
+            # Exact bytes only: a 9x8 dHash cannot see HP bars or menu text, and a
+            # near match on disk would be served for the whole TTL.
+            store_key = cache_key(prompt, digest) if analysis_store is not None else None
+            if cached is None and store_key is not None:
+                reply = analysis_store.get(store_key)
+                stored = parse_analysis(reply) if reply is not None else None
+                if stored is not None:
+                    cached = (reply, stored)
+                    if analysis_cache is not None:
+                        analysis_cache.put(digest, dhash, cached)
+            # A reused analysis made no tool calls.
+            run_calls: list[dict[str, Any]] = []
+            if cached is not None:
+                content, parsed = cached
+            else:
+                try:
+                    # Per-run, not the shared log: with ANALYSIS_CONCURRENCY > 1 another
+                    # worker's run would otherwise take this frame's tool calls.
+                    with record_pokemon_calls() as run_calls:
+                        content = await analyze_image_async(analysis_agent, image_b64, prompt)
+                except Exception as exc:
+                    _emit(
+                        handlers_error,
+                        {
+                            "type": "analysis_error",
+                            "timestamp": captured_ts,
+                            "message": f"Analysis error: {exc}",
+                            "image_path": _relative_image_path(out_path),
+                        },
+                    )
+                    continue
 
-            recent_analyses.append(data)
-            capture_count += 1
-
-            analysis_payload = {
-                "type": "analysis",
-                "timestamp": timestamp,
-                "image_path": image_relative,
-                "data": data,
-                "raw": content,
-                "capture_index": capture_count,
-                "meta": {
-                    "battle_detected": battle_detected,
-                    "participants": participants,
-                    "tool_called": tool_called,
-                    "stats_integrated": stats_integrated,
-                    "latest_calls": latest_calls,
-                },
-            }
-            _emit(handlers_analysis, analysis_payload)
-
-            if capture_count % summary_interval == 0:
-                new_entries = recent_analyses[last_summary_len:]
-                if new_entries:
-                    try:
-                        summary = generate_summary(summary_agent, new_entries, cumulative_summary)
-                        cumulative_summary = summary
-                        last_summary_len = len(recent_analyses)
-                        summary_timestamp = datetime.now().isoformat(timespec="seconds")
-                        summary_payload = {
-                            "type": "summary",
-                            "timestamp": summary_timestamp,
-                            "summary": cumulative_summary,
-                            "capture_total": capture_count,
-                            "window": len(new_entries),
-                            "delta": len(new_entries),
-                            "interval": summary_interval,
-                            "cumulative": True,
-                        }
-                        summary_audio = synthesize_summary_audio(cumulative_summary, cfg)
-                        if summary_audio:
-                            summary_payload["summary_audio"] = summary_audio
-                        _emit(handlers_summary, summary_payload)
-                    except Exception as exc:
-                        _emit(
-                            handlers_error,
-                            {
-                                "type": "analysis_error",
-                                "timestamp": datetime.now().isoformat(timespec="seconds"),
-                                "message": f"Summary generation error: {exc}",
-                            },
-                        )
-        else:
-            _emit(
-                handlers_error,
-                {
-                    "type": "analysis_error",
+                parsed = parse_analysis(content)
+                if parsed is not None:
+                    if analysis_cache is not None:
+                        analysis_cache.put(digest, dhash, (content, parsed))
+                    if store_key is not None:
+                        analysis_store.set(store_key, content)
+
+            timestamp = captured_ts
+            image_relative = _relative_image_path(out_path)
+
+            if parsed is not None:
+                data, analysis = parsed
+                latest_calls = run_calls
+                battle_detected = "battle" in str(analysis.scene or "").lower()
+                participants = [
+                    name
+                    for name in (str(ch.name or "").strip() for ch in (analysis.characters or ()) if ch is not None)
+                    if name
+                ]
+                tool_called = bool(latest_calls)
+                stats_integrated = False
+                if battle_detected and participants:
+                    # Only battles need the lookup set; build it flat and test all names in one call.
+                    call_names = frozenset(
+                        str(name).lower() for entry in latest_calls for name in entry.get("names", ())
+                    )
+                    stats_integrated = call_names.issuperset(name.lower() for name in participants)
+
+                if cached is None:
+                    # A revisited screen adds nothing new to summarise.
+                    unsummarized.append(data)
+                capture_count += 1
+
+                analysis_payload = {
+                    "type": "analysis",
                     "timestamp": timestamp,
-                    "message": "Failed to parse JSON. Raw response:",
-                    "raw": content,
                     "image_path": image_relative,
-                },
-            )
+                    "data": data,
+                    "raw": content,
+                    "capture_index": capture_count,
+                    "cached": cached is not None,
+                    "meta": {
+                        "battle_detected": battle_detected,
+                        "participants": participants,
+                        "tool_called": tool_called,
+                        "stats_integrated": stats_integrated,
+                        "latest_calls": latest_calls,
+                    },
+                }
+                _emit(handlers_analysis, analysis_payload)
+
+                # While a summary is still in flight these analyses wait for the next
+                # tick rather than racing it on cumulative_summary.
+                if (
+                    capture_count % summary_interval == 0
+                    and unsummarized
+                    and (summary_task is None or summary_task.done())
+                ):
+                    new_entries = list(unsummarized)
+                    unsummarized.clear()
+                    summary_task = asyncio.create_task(_summarize(new_entries, capture_count))
+            else:
+                _emit(
+                    handlers_error,
+                    {
+                        "type": "analysis_error",
+                        "timestamp": timestamp,
+                        "message": "Failed to parse JSON. Raw response:",
+                        "raw": content,
+                        "image_path": image_relative,
+                    },
+                )
+
+    # Each worker takes a different (the newest) frame, so with N workers up to N
+    # model calls are in flight; FrameRing never hands one frame out twice.
+    await asyncio.gather(*(_analysis_worker() for _ in range(analysis_concurrency)))
+
+    if summary_task is not None:
+        await summary_task
+    producer_stop.set()
+    await asyncio.to_thread(producer.join, cfg["interval"] + 5)
+    if capturer is not None:
+        capturer.stop()
+    if frame_log is not None:
+        frame_log.close()
+    if analysis_store is not None:
+        analysis_store.close()
+    if tts_client is not None and loop_openai is None:
+        await tts_client.close()
+    await _close_loop_openai()
+
+_CHANNELS = {"analysis": analysis_channel, "summary": summary_channel, "error": analysis_channel}
+# Payload types sent as named SSE events, so `onmessage` clients never see them.
+_NAMED_EVENT_TYPES = frozenset({"summary_delta", "summary_failed"})
+# Named events that are only previews: kept out of the resumable ring, newest wins.
+# summary_failed takes the preview's slot, so late joiners never see a stale one.
+_LIVE_EVENT_TYPES = frozenset({"summary_delta", "summary_failed"})
+
+
+def _capture_process_main(cfg: dict[str, Any], prompt: str, events: Any) -> None:
+    """Entry point of the capture worker process; forwards payloads as (kind, payload)."""
+
+    # Agents hold clients and locks and don't pickle, so the worker builds its own.
+    analysis_agent, summary_agent = build_agents(cfg["model"])
+    try:
+        run_capture_loop(
+            cfg,
+            analysis_agent,
+            summary_agent,
+            prompt,
+            analysis_handlers=[lambda payload: events.put(("analysis", payload))],
+            summary_handlers=[lambda payload: events.put(("summary", payload))],
+            error_handlers=[lambda payload: events.put(("error", payload))],
+        )
+    except KeyboardInterrupt:
+        pass
+
+
+def _forward_capture_events(events: Any) -> None:
+    """Publish payloads from the capture worker into this process's channels."""
+
+    while True:
+        kind, payload = events.get()
+        payload_type = payload.get("type")
+        if payload_type in _LIVE_EVENT_TYPES:
+            _CHANNELS[kind].publish_live(payload, payload_type)
+        else:
+            _CHANNELS[kind].publish(payload, payload_type if payload_type in _NAMED_EVENT_TYPES else None)
+
+
+def _watch_capture_process(process: Any) -> None:
+    """Drop the running flag when the worker exits, so the next request restarts it."""
+
+    process.join()
+    with _capture_lock:
+        if _capture_process is process:
+            _capture_running.clear()
 
-        time.sleep(cfg["interval"])
 
 def start_capture_thread(
     cfg: dict[str, Any],
@@ -825,40 +1595,55 @@ def start_capture_thread(
     summary_agent: Agent,
     prompt: str,
 ) -> None:
-    """Ensure the capture loop runs in a daemon thread for streaming."""
+    """
+    Ensure the capture loop runs in a daemon worker process for streaming.
+    Frame encoding, analysis and parsing then never hold the web server's GIL; a
+    single forwarding thread here republishes the worker's payloads. The agents
+    passed in are unused (the worker builds its own) and kept for API compatibility.
+    """
+
+    global _capture_process, _capture_events
 
-    global _capture_thread
+    # Every page load and SSE (re)connect lands here; once the worker runs, a flag
+    # read replaces the directory check, the lock and is_alive()'s waitpid.
+    if _capture_running.is_set():
+        return
 
     ensure_out_dir(cfg["out_dir"], clear=False)
 
     with _capture_lock:
-        if _capture_thread and _capture_thread.is_alive():
+        if _capture_process and _capture_process.is_alive():
+            _capture_running.set()
             return
 
-        def handle_analysis(payload: Dict[str, Any]) -> None:
-            analysis_channel.publish(payload)
-
-        def handle_summary(payload: Dict[str, Any]) -> None:
-            summary_channel.publish(payload)
-
-        def handle_error(payload: Dict[str, Any]) -> None:
-            analysis_channel.publish(payload)
-
-        def loop() -> None:
-            # Set up event loop for this thread so async operations work
-            asyncio.set_event_loop(asyncio.new_event_loop())
-            run_capture_loop(
-                cfg,
-                analysis_agent,
-                summary_agent,
-                prompt,
-                analysis_handlers=[handle_analysis],
-                summary_handlers=[handle_summary],
-                error_handlers=[handle_error],
-            )
+        ctx = multiprocessing.get_context("spawn")
+        if _capture_events is None:
+            _capture_events = ctx.Queue()
+            threading.Thread(
+                target=_forward_capture_events,
+                args=(_capture_events,),
+                name="capture-events",
+                daemon=True,
+            ).start()
+
+        _capture_process = ctx.Process(
+            target=_capture_process_main,
+            args=(cfg, prompt, _capture_events),
+            name="capture-loop",
+            daemon=True,
+        )
+        _capture_process.start()
+        _capture_running.set()
+        threading.Thread(
+            target=_watch_capture_process,
+            args=(_capture_process,),
+            name="capture-watch",
+            daemon=True,
+        ).start()
 
-        _capture_thread = threading.Thread(target=loop, name="capture-loop", daemon=True)
-        _capture_thread.start()
+
+async def _start_pokeapi_warmup() -> None:
+    start_warmup()
 
 
 def _create_web_app(
@@ -866,8 +1651,12 @@ def _create_web_app(
     analysis_agent: Agent,
     summary_agent: Agent,
     prompt: str,
-) -> Flask:
-    app = Flask(__name__)
+) -> Quart:
+    app = Quart(__name__)
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
+    # Warm the PokéAPI cache once the server is actually up, not on import.
+    app.before_serving(_start_pokeapi_warmup)
     
     # Create chat agent
     chat_agent = build_chat_agent(cfg["model"])
@@ -876,39 +1665,39 @@ def _create_web_app(
         start_capture_thread(cfg, analysis_agent, summary_agent, prompt)
 
     @app.route("/")
-    def index() -> str:
+    async def index() -> str:
         ensure_thread()
-        return render_template("index.html")
+        return await render_template("index.html")
 
     @app.route("/stream/analysis")
-    def stream_analysis() -> Response:
+    async def stream_analysis() -> Response:
         ensure_thread()
         return _event_response(analysis_channel)
 
     @app.route("/stream/summaries")
-    def stream_summaries() -> Response:
+    async def stream_summaries() -> Response:
         ensure_thread()
         return _event_response(summary_channel)
 
     @app.route("/api/chat", methods=["POST"])
-    def chat_endpoint():
+    async def chat_endpoint():
         """Handle chat messages and return PokéAPI responses."""
         try:
-            data = request.get_json()
+            data = await request.get_json()
             if not data:
-                return jsonify({"error": "No JSON data provided"}), 400
+                return json_response({"error": "No JSON data provided"}, 400)
                 
             message = data.get("message", "")
             if not message:
-                return jsonify({"error": "No message provided"}), 400
-            response = process_chat_message(chat_agent, message)
+                return json_response({"error": "No message provided"}, 400)
+            response = await process_chat_message_async(chat_agent, message)
             
-            return jsonify({
+            return json_response({
                 "response": response,
                 "timestamp": datetime.now().isoformat()
             })
         except Exception as e:
-            return jsonify({"error": f"Chat error: {str(e)}"}), 500
+            return json_response({"error": f"Chat error: {str(e)}"}, 500)
 
     return app
 
@@ -937,12 +1726,25 @@ def serve_web_app(
 
     start_capture_thread(cfg, analysis_agent, summary_agent, prompt)
 
-    print(f"Streaming UI available at http://{host}:{port}")
-    app.run(host=host, port=port, debug=False)
+    # One worker only: the capture thread and the broadcast channels live in-process,
+    # and every SSE viewer is a coroutine on this server's single event loop.
+    config = HypercornConfig()
+    config.bind = [f"{host}:{port}"]
+    config.workers = 1
+    scheme = "http"
+    if cfg.get("ui_certfile") and cfg.get("ui_keyfile"):
+        # Browsers only speak HTTP/2 over TLS; with it, the analysis and summary
+        # streams share one multiplexed connection instead of using two.
+        config.certfile = str(cfg["ui_certfile"])
+        config.keyfile = str(cfg["ui_keyfile"])
+        scheme = "https"
+
+    print(f"Streaming UI available at {scheme}://{host}:{port}")
+    asyncio.run(hypercorn_serve(app, config))
 
 
-def create_app() -> Flask:
-    """Flask factory for `flask run`. Ensures capture loop starts once."""
+def create_app() -> Quart:
+    """ASGI factory for `hypercorn web_app:app`. Ensures capture loop starts once."""
 
     cfg = load_config()
     ensure_out_dir(cfg["out_dir"], clear=True)
@@ -950,9 +1752,6 @@ def create_app() -> Flask:
     analysis_agent, summary_agent = build_agents(cfg["model"])
     prompt = build_analysis_prompt()
 
-    os.environ.setdefault("FLASK_RUN_HOST", cfg["ui_host"])
-    os.environ.setdefault("FLASK_RUN_PORT", str(cfg["ui_port"]))
-
     start_capture_thread(cfg, analysis_agent, summary_agent, prompt)
     return _create_web_app(cfg, analysis_agent, summary_agent, prompt)
 
@@ -973,9 +1772,17 @@ def main() -> None:
         type=int,
         help="Override STREAM_UI_PORT when running the web UI",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Analyse every frame with the model, ignoring cached analyses",
+    )
     args = parser.parse_args()
 
     cfg = load_config()
+    if args.no_cache:
+        cfg["analysis_cache_size"] = 0
+        cfg["analysis_cache_path"] = ""
     if args.ui_host:
         cfg["ui_host"] = args.ui_host
     if args.ui_port is not None:
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test script for frame-analysis reply parsing.
+Checks that replies the model sends off-schema still publish their data untouched.
+"""
+
+import sys
+from pathlib import Path
+
+# Add the current directory to the path so we can import retroarch_capture
+sys.path.insert(0, str(Path(__file__).parent))
+
+from retroarch_capture import parse_analysis
+
+OFF_SCHEMA_REPLY = """```json
+{
+  "game_name": "Pokemon Red",
+  "scene": "battle",
+  "characters": [
+    {"name": "Pikachu", "level": "12", "hp_current": true, "hp_max": 35, "status": null},
+    {"name": "Geodude", "level": 10, "moves": ["tackle"]}
+  ],
+  "environment": {"area": "Route 3"},
+  "notable_events": ["Wild Geodude appeared", "Pikachu used Thundershock"],
+  "weather": null,
+  "confidence": 0.8
+}
+```"""
+
+
+def main():
+    print("=" * 60)
+    print("Frame Analysis Parsing Test")
+    print("=" * 60)
+
+    parsed = parse_analysis(OFF_SCHEMA_REPLY)
+    assert parsed is not None, "off-schema reply was rejected"
+    data, analysis = parsed
+
+    # The published data is the reply as sent: extra keys, nulls and odd types survive.
+    assert data["notable_events"] == ["Wild Geodude appeared", "Pikachu used Thundershock"]
+    assert data["environment"] == {"area": "Route 3"}
+    assert data["characters"][0]["hp_current"] is True
+    assert data["characters"][0]["status"] is None
+    assert data["characters"][1]["moves"] == ["tackle"]
+    assert "weather" in data and data["weather"] is None
+    assert data["confidence"] == 0.8
+    print("✅ Off-schema reply kept as sent")
+
+    # The typed view still exposes what the capture loop reads.
+    assert analysis.scene == "battle"
+    assert [ch.name for ch in analysis.characters] == ["Pikachu", "Geodude"]
+    print("✅ Scene and participants read from the typed view")
+
+    # A characters block of the wrong shape empties the view but keeps the data.
+    parsed = parse_analysis('{"scene": "menu", "characters": "none visible"}')
+    assert parsed is not None
+    data, analysis = parsed
+    assert data["characters"] == "none visible"
+    assert analysis.characters is None
+    print("✅ Malformed characters block does not reject the frame")
+
+    # Only replies that are not a JSON object are rejected.
+    assert parse_analysis('[{"scene": "battle"}]') is None
+    assert parse_analysis("The screen is black.") is None
+    print("✅ Non-object replies rejected")
+
+    print()
+    print("All parsing checks passed.")
+
+
+if __name__ == "__main__":
+    main()
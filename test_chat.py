@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
 """Test script for the PokéAPI chat functionality."""
 
+import asyncio
 import os
 from dotenv import load_dotenv
-from retroarch_capture import build_chat_agent, process_chat_message
+from retroarch_capture import build_chat_agent, process_chat_message_async
 
-def main():
+async def main():
     load_dotenv()
     
     # Create chat agent
@@ -23,14 +24,19 @@ def main():
     print("Testing PokéAPI Chat Agent")
     print("=" * 50)
     
-    for message in test_messages:
+    # Ask everything at once; total time is the slowest answer, not the sum.
+    responses = await asyncio.gather(
+        *(process_chat_message_async(chat_agent, message) for message in test_messages),
+        return_exceptions=True,
+    )
+    
+    for message, response in zip(test_messages, responses):
         print(f"\nQuestion: {message}")
-        try:
-            response = process_chat_message(chat_agent, message)
+        if isinstance(response, Exception):
+            print(f"Error: {response}")
+        else:
             print(f"Answer: {response}")
-        except Exception as e:
-            print(f"Error: {e}")
         print("-" * 50)
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -8,10 +8,11 @@ import os
 import sys
 from pathlib import Path
 
-# Add the current directory to the path so we can import retroarch_capture
+# Add the current directory to the path so we can import window_detection
 sys.path.insert(0, str(Path(__file__).parent))
 
-from retroarch_capture import osascript_get_bounds, list_all_windows
+# window_detection skips the Agents SDK and web stack that retroarch_capture loads.
+from window_detection import get_bounds_cached, list_all_windows
 from dotenv import load_dotenv
 
 
@@ -29,7 +30,8 @@ def main():
     print()
     
     # Try to detect the window
-    bounds = osascript_get_bounds(app_name)
+    # Same lookup the capture loop uses: Quartz when pyobjc is installed, else osascript.
+    bounds = get_bounds_cached(app_name, refresh=True)
     
     if bounds:
         x, y, w, h = bounds
@@ -0,0 +1,51 @@
+"""Static Pokémon type-effectiveness chart (Generation VI onward).
+
+Mirrors the `damage_relations` block of PokéAPI's `/type/{name}/` endpoint for the
+18 battle types so type lookups never need a network round-trip. Only the attacking
+side is written out; the defending (`*_from`) lists are derived at import time.
+Entries are ordered by PokéAPI type id, matching the order the API returns.
+"""
+
+from typing import Dict, List, Union
+
+# name -> (id, generation introduced, double_damage_to, half_damage_to, no_damage_to)
+_ATTACKING = {
+    "normal": (1, "generation-i", [], ["rock", "steel"], ["ghost"]),
+    "fighting": (2, "generation-i", ["normal", "rock", "steel", "ice", "dark"], ["flying", "poison", "bug", "psychic", "fairy"], ["ghost"]),
+    "flying": (3, "generation-i", ["fighting", "bug", "grass"], ["rock", "steel", "electric"], []),
+    "poison": (4, "generation-i", ["grass", "fairy"], ["poison", "ground", "rock", "ghost"], ["steel"]),
+    "ground": (5, "generation-i", ["poison", "rock", "steel", "fire", "electric"], ["bug", "grass"], ["flying"]),
+    "rock": (6, "generation-i", ["flying", "bug", "fire", "ice"], ["fighting", "ground", "steel"], []),
+    "bug": (7, "generation-i", ["grass", "psychic", "dark"], ["fighting", "flying", "poison", "ghost", "steel", "fire", "fairy"], []),
+    "ghost": (8, "generation-i", ["ghost", "psychic"], ["dark"], ["normal"]),
+    "steel": (9, "generation-ii", ["rock", "ice", "fairy"], ["steel", "fire", "water", "electric"], []),
+    "fire": (10, "generation-i", ["bug", "steel", "grass", "ice"], ["rock", "fire", "water", "dragon"], []),
+    "water": (11, "generation-i", ["ground", "rock", "fire"], ["water", "grass", "dragon"], []),
+    "grass": (12, "generation-i", ["ground", "rock", "water"], ["flying", "poison", "bug", "steel", "fire", "grass", "dragon"], []),
+    "electric": (13, "generation-i", ["flying", "water"], ["grass", "electric", "dragon"], ["ground"]),
+    "psychic": (14, "generation-i", ["fighting", "poison"], ["steel", "psychic"], ["dark"]),
+    "ice": (15, "generation-i", ["flying", "ground", "grass", "dragon"], ["steel", "fire", "water", "ice"], []),
+    "dragon": (16, "generation-i", ["dragon"], ["steel"], ["fairy"]),
+    "dark": (17, "generation-ii", ["ghost", "psychic"], ["fighting", "dark", "fairy"], []),
+    "fairy": (18, "generation-vi", ["fighting", "dragon", "dark"], ["poison", "steel", "fire"], []),
+}
+
+
+def _build_chart() -> Dict[str, Dict[str, Union[int, str, List[str]]]]:
+    chart: Dict[str, Dict[str, Union[int, str, List[str]]]] = {}
+    for name, (type_id, generation, double_to, half_to, no_to) in _ATTACKING.items():
+        chart[name] = {
+            "id": type_id,
+            "generation": generation,
+            "double_damage_to": double_to,
+            "half_damage_to": half_to,
+            "no_damage_to": no_to,
+            "double_damage_from": [a for a, rel in _ATTACKING.items() if name in rel[2]],
+            "half_damage_from": [a for a, rel in _ATTACKING.items() if name in rel[3]],
+            "no_damage_from": [a for a, rel in _ATTACKING.items() if name in rel[4]],
+        }
+    return chart
+
+
+TYPE_CHART = _build_chart()
+TYPE_NAMES_BY_ID = {str(entry["id"]): name for name, entry in TYPE_CHART.items()}
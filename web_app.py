@@ -4,7 +4,10 @@ from __future__ import annotations
 
 from retroarch_capture import create_app, serve_web_app
 
-app = create_app()
+# The spawned capture worker re-imports this script as __mp_main__; only the
+# server process should build the app (and start a worker of its own).
+if __name__ != "__mp_main__":
+    app = create_app()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,277 @@
+"""Locate the capture source's window on macOS without the agent or web stack.
+
+Kept apart from retroarch_capture so `test_window_detection.py` (and anything else
+that only needs window bounds) starts without importing the Agents SDK, Quart or
+hypercorn. Lookups use the in-process Quartz window list when pyobjc is installed and
+otherwise ask a long-lived osascript coprocess, falling back to one-shot AppleScript.
+"""
+
+import atexit
+import json
+import os
+import re
+import select
+import subprocess
+import threading
+import time
+from typing import Any
+
+from macos_capture import QUARTZ_AVAILABLE, quartz_list_windows, quartz_window_bounds
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+if orjson is not None:
+    _dumps_bytes = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    _loads = json.loads
+
+
+# JXA server for OsaRepl: answers one JSON request line with one JSON reply line.
+_OSA_SERVER_JS = r"""
+ObjC.import('Foundation');
+const se = Application('System Events');
+const input = $.NSFileHandle.fileHandleWithStandardInput;
+const output = $.NSFileHandle.fileHandleWithStandardOutput;
+
+function reply(obj) {
+  output.writeData($(JSON.stringify(obj) + '\n').dataUsingEncoding($.NSUTF8StringEncoding));
+}
+
+function bounds(app) {
+  const procs = se.processes.whose({ name: app });
+  if (procs.length === 0 || procs[0].windows.length === 0) return null;
+  const win = procs[0].windows[0];
+  const [x, y] = win.position();
+  const [w, h] = win.size();
+  return [x, y, w, h];
+}
+
+function windows() {
+  const found = [];
+  for (const proc of se.processes.whose({ visible: true })()) {
+    const procName = proc.name();
+    try {
+      for (const winName of proc.windows.name()) found.push([procName, winName]);
+    } catch (e) {}
+  }
+  return found;
+}
+
+let pending = '';
+for (;;) {
+  const data = input.availableData;
+  if (data.length === 0) break;
+  pending += $.NSString.alloc.initWithDataEncoding(data, $.NSUTF8StringEncoding).js;
+  let nl;
+  while ((nl = pending.indexOf('\n')) >= 0) {
+    const line = pending.slice(0, nl);
+    pending = pending.slice(nl + 1);
+    try {
+      const req = JSON.parse(line);
+      reply({ ok: true, result: req.op === 'windows' ? windows() : bounds(req.app) });
+    } catch (e) {
+      reply({ ok: false, error: String(e) });
+    }
+  }
+}
+"""
+
+
+class OsaRepl:
+    """
+    A long-lived `osascript` (JXA) process answering window queries over stdin/stdout.
+    Saves the fork+exec and script compile of a fresh osascript per lookup; the
+    process is respawned lazily if it dies or stops answering.
+    """
+
+    def __init__(self, timeout: float = 3.0) -> None:
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._proc: subprocess.Popen | None = None
+        self._buf = b""
+
+    def _spawn(self) -> subprocess.Popen:
+        self._proc = subprocess.Popen(
+            ["osascript", "-l", "JavaScript", "-e", _OSA_SERVER_JS],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        self._buf = b""
+        return self._proc
+
+    def close(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is not None and proc.poll() is None:
+            proc.kill()
+            proc.wait()
+
+    def run(self, request: dict[str, Any]) -> Any:
+        """Send one request and return its result; raises RuntimeError on any failure."""
+        with self._lock:
+            proc = self._proc if self._proc is not None and self._proc.poll() is None else self._spawn()
+            try:
+                proc.stdin.write(_dumps_bytes(request) + b"\n")
+                proc.stdin.flush()
+                reply = _loads(self._read_line(proc))
+            except Exception as exc:
+                self.close()
+                raise RuntimeError(f"osascript coprocess failed: {exc}") from exc
+        if not reply.get("ok"):
+            raise RuntimeError(reply.get("error") or "osascript coprocess error")
+        return reply.get("result")
+
+    def _read_line(self, proc: subprocess.Popen) -> bytes:
+        deadline = time.monotonic() + self._timeout
+        fd = proc.stdout.fileno()
+        while (nl := self._buf.find(b"\n")) < 0:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                raise TimeoutError("no reply")
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                raise EOFError("coprocess exited")
+            self._buf += chunk
+        line, self._buf = self._buf[:nl], self._buf[nl + 1:]
+        return line
+
+
+_OSA = OsaRepl()
+atexit.register(_OSA.close)
+
+
+def list_all_windows() -> list[tuple[str, str]]:
+    """
+    Return a list of (process_name, window_name) for all visible windows.
+    Useful for debugging window detection issues.
+    """
+    if QUARTZ_AVAILABLE:
+        return quartz_list_windows()
+    try:
+        return [(str(proc), str(win)) for proc, win in _OSA.run({"op": "windows"})]
+    except Exception:
+        return _list_all_windows_once()
+
+
+def _list_all_windows_once() -> list[tuple[str, str]]:
+    script = '''
+    tell application "System Events"
+        set windowList to {}
+        repeat with proc in (every process whose visible is true)
+            set procName to name of proc
+            try
+                repeat with win in (windows of proc)
+                    set winName to name of win
+                    set end of windowList to procName & " | " & winName
+                end repeat
+            end try
+        end repeat
+        return windowList
+    end tell
+    '''
+    try:
+        result = subprocess.run([
+            "osascript", "-e", script
+        ], capture_output=True, text=True, check=True)
+        out = result.stdout.strip()
+        if not out:
+            return []
+        # Parse the list format from AppleScript
+        items = out.split(", ")
+        windows = []
+        for item in items:
+            if " | " in item:
+                parts = item.split(" | ", 1)
+                windows.append((parts[0].strip(), parts[1].strip()))
+        return windows
+    except Exception:
+        return []
+
+
+def osascript_get_bounds(app_name: str) -> tuple[int, int, int, int] | None:
+    """
+    Return (x, y, width, height) of the front window of app_name.
+    Asks the persistent osascript coprocess, falling back to a one-shot
+    AppleScript run if it is unavailable. Returns None if not available.
+    """
+    try:
+        result = _OSA.run({"op": "bounds", "app": app_name})
+    except Exception:
+        return _osascript_get_bounds_once(app_name)
+    if not result:
+        return None
+    x, y, width, height = (int(v) for v in result)
+    if width <= 0 or height <= 0:
+        return None
+    return x, y, width, height
+
+
+_BOUNDS_INT_RE = re.compile(rb"-?\d+")
+
+
+def _osascript_get_bounds_once(app_name: str) -> tuple[int, int, int, int] | None:
+    script = f'''
+    tell application "System Events"
+        if exists process "{app_name}" then
+            tell process "{app_name}"
+                if exists window 1 then
+                    set b to bounds of window 1
+                    return b
+                else
+                    return "NO_WINDOW"
+                end if
+            end tell
+        else
+            return "NO_PROCESS"
+        end if
+    end tell
+    '''
+    try:
+        # Bounds are ASCII: parse the raw bytes instead of decoding them as text.
+        result = subprocess.run(
+            ["osascript", "-e", script],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
+        # AppleScript bounds are: left, top, right, bottom; NO_WINDOW/NO_PROCESS have no digits.
+        parts = [int(p) for p in _BOUNDS_INT_RE.findall(result.stdout)]
+        if len(parts) != 4:
+            return None
+        left, top, right, bottom = parts
+        width = max(0, right - left)
+        height = max(0, bottom - top)
+        if width == 0 or height == 0:
+            return None
+        return left, top, width, height
+    except subprocess.CalledProcessError:
+        return None
+    except Exception:
+        return None
+
+
+_BOUNDS_TTL_SECONDS = 10.0
+_bounds_cache: dict[str, Any] = {"ts": 0.0, "bounds": None, "app": None}
+
+
+def get_bounds_cached(app_name: str, ttl: float = _BOUNDS_TTL_SECONDS, refresh: bool = False) -> tuple[int, int, int, int] | None:
+    """
+    Return app_name's window bounds, re-reading them at most every ttl seconds.
+    Uses the in-process Quartz window list when pyobjc is installed, else osascript.
+    Pass refresh=True after a failed capture to force a new lookup.
+    """
+    now = time.monotonic()
+    cache = _bounds_cache
+    if not refresh and cache["app"] == app_name and now - cache["ts"] < ttl:
+        return cache["bounds"]
+    bounds = quartz_window_bounds(app_name) if QUARTZ_AVAILABLE else osascript_get_bounds(app_name)
+    cache.update(ts=now, bounds=bounds, app=app_name)
+    return bounds